@@ -0,0 +1,144 @@
+"""Bytes per model instance: __slots__ layout vs. a __dict__-backed copy.
+
+The dict-backed variant is a copy of each model class with the same methods
+and field table but no ``__slots__`` (and no slotted base), so every
+attribute lands in an instance ``__dict__``, which is how the models were
+laid out before. Both are built from the same payload, so shared values cost
+the same and the difference is the per-instance attribute storage.
+
+    python benchmarks/model_memory.py [instances]
+"""
+from __future__ import annotations
+import gc
+import os
+import sys
+import tracemalloc
+import types
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from fiesta.models import Channel, Guild, Member, Message, Role, User  # noqa: E402
+
+
+USER = {
+    "id": "80351110224678912",
+    "username": "nelly",
+    "discriminator": "0",
+    "global_name": "Nelly",
+    "avatar": "8342729096ea3675442027381ff50dfe",
+    "bot": False,
+    "flags": 64,
+    "public_flags": 64,
+}
+ROLE = {
+    "id": "41771983423143936",
+    "name": "WE DEM BOYZZ!!!!!!",
+    "color": 3447003,
+    "hoist": True,
+    "position": 1,
+    "permissions": "66321471",
+    "managed": False,
+    "mentionable": False,
+}
+CHANNEL = {
+    "id": "41771983423143937",
+    "guild_id": "41771983423143936",
+    "name": "general",
+    "type": 0,
+    "position": 6,
+    "rate_limit_per_user": 2,
+    "nsfw": True,
+    "topic": "24/7 chat about how to gank Mike #2",
+    "last_message_id": "155117677105512449",
+    "parent_id": "399942396007890945",
+    "default_auto_archive_duration": 60,
+}
+GUILD = {
+    "id": "197038439483310086",
+    "name": "Discord Testers",
+    "icon": "f64c482b807da4f539cff778d174971c",
+    "owner_id": "73193882359173120",
+    "afk_timeout": 300,
+    "verification_level": 3,
+    "default_message_notifications": 1,
+    "explicit_content_filter": 2,
+    "features": ["ANIMATED_ICON", "VERIFIED", "NEWS", "VANITY_URL"],
+    "mfa_level": 1,
+    "system_channel_id": "197038439483310086",
+    "rules_channel_id": "441688182833020939",
+    "max_members": 500000,
+    "vanity_url_code": "discord-testers",
+    "premium_tier": 3,
+    "premium_subscription_count": 33,
+    "preferred_locale": "en-US",
+    "nsfw_level": 0,
+}
+MEMBER = {
+    "user": USER,
+    "nick": "NOT API SUPPORT",
+    "roles": ["41771983423143936"],
+    "joined_at": "2015-04-26T06:26:56.936000+00:00",
+    "deaf": False,
+    "mute": False,
+}
+MESSAGE = {
+    "id": "334385199974967042",
+    "channel_id": "290926798999357250",
+    "author": USER,
+    "content": "Supa Hot",
+    "timestamp": "2017-07-11T17:27:07.299000+00:00",
+    "type": 0,
+    "pinned": False,
+    "tts": False,
+    "mention_everyone": False,
+}
+
+CASES: List[Tuple[type, Dict[str, Any], Callable[[type, Dict[str, Any]], Any]]] = [
+    (User, USER, lambda cls, data: cls(data)),
+    (Role, ROLE, lambda cls, data: cls(data)),
+    (Channel, CHANNEL, lambda cls, data: cls(data)),
+    (Guild, GUILD, lambda cls, data: cls(data)),
+    (Member, MEMBER, lambda cls, data: cls(data, guild_id=197038439483310086)),
+    (Message, MESSAGE, lambda cls, data: cls(data)),
+]
+
+
+def dict_backed(cls: type) -> type:
+    # Subclassing would keep the inherited slots (and fill them), so the
+    # class body is copied onto a plain object base instead.
+    namespace: Dict[str, Any] = {}
+    for klass in reversed(cls.__mro__[:-1]):
+        for name, value in vars(klass).items():
+            if name in ("__slots__", "__dict__", "__weakref__", "__init_subclass__"):
+                continue
+            if isinstance(value, types.MemberDescriptorType):
+                continue  # A slot
+            namespace[name] = value
+    return type(f"{cls.__name__}WithDict", (object,), namespace)
+
+
+def bytes_per_instance(factory: Callable[[], Any], count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The list holding them is not part of the model's cost.
+    return (after - before - sys.getsizeof(objects)) / count
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    print(f"{'model':<10}{'__dict__':>12}{'__slots__':>12}{'saved':>10}")
+    for cls, data, build in CASES:
+        legacy = dict_backed(cls)
+        assert vars(build(legacy, data)), f"{legacy.__name__} left its __dict__ empty"
+        old = bytes_per_instance(lambda: build(legacy, data), count)
+        new = bytes_per_instance(lambda: build(cls, data), count)
+        print(f"{cls.__name__:<10}{old:>12.0f}{new:>12.0f}{1 - new / old:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
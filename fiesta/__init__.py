@@ -2,7 +2,10 @@ __version__ = "1.0.0"
 __author__ = "fiestapy"
 
 from .client import Client
+from .shard import AutoShardedClient, IdentifyScheduler
+from .cluster import ClusterLauncher
 from .intents import Intents
+from .file import File
 from .errors import *
 
-__all__ = ["Client", "Intents"]
+__all__ = ["Client", "AutoShardedClient", "IdentifyScheduler", "ClusterLauncher", "Intents", "File"]
@@ -0,0 +1,183 @@
+from __future__ import annotations
+import asyncio
+import hashlib
+import json
+import os
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    TextIO,
+    Union,
+)
+
+from .errors import Forbidden, NotFound
+
+if TYPE_CHECKING:
+    from .http import HTTPClient, Priority
+
+
+# Errors that will not go away by sending again; these targets are checkpointed.
+PERMANENT_ERRORS = (Forbidden, NotFound)
+
+
+class BroadcastResult(NamedTuple):
+    target: int
+    message: Optional[Dict[str, Any]] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class Broadcast:
+    """Sends one message payload to many channels, or users with ``dm=True``"""
+
+    def __init__(
+        self,
+        http: "HTTPClient",
+        payload: Dict[str, Any],
+        targets: Iterable[int],
+        *,
+        dm: bool = False,
+        checkpoint: Optional[Union[str, "os.PathLike[str]"]] = None,
+        concurrency: int = 50,
+        priority: Optional["Priority"] = None,
+    ):
+        if priority is None:
+            from .http import Priority
+
+            priority = Priority.LOW
+        self.http = http
+        self.dm = dm
+        self.concurrency = concurrency
+        self.priority = priority
+        self.checkpoint = os.fspath(checkpoint) if checkpoint is not None else None
+        self._encoded = http.codec.dumps_bytes(payload)
+        self._key = hashlib.blake2b(self._encoded, digest_size=8).digest()
+
+        done = self._load_checkpoint()
+        seen: Set[int] = set()
+        self.targets: List[int] = []
+        for target in targets:
+            target = int(target)
+            if target not in seen and target not in done:
+                seen.add(target)
+                self.targets.append(target)
+        self.skipped = len(done)
+
+        self._results: "asyncio.Queue[BroadcastResult]" = asyncio.Queue()
+        self._workers: List[asyncio.Task[None]] = []
+        self._checkpoint_fp: Optional[TextIO] = None
+        self.sent = 0
+        self.failed = 0
+
+    def _load_checkpoint(self) -> Set[int]:
+        done: Set[int] = set()
+        if not self.checkpoint or not os.path.exists(self.checkpoint):
+            return done
+        with open(self.checkpoint, encoding="utf-8") as fp:
+            for line in fp:
+                try:
+                    done.add(int(json.loads(line)["target"]))
+                except (ValueError, KeyError, TypeError):
+                    continue  # Torn final line from an interrupted write
+        return done
+
+    def _record(self, result: BroadcastResult) -> None:
+        if result.ok:
+            self.sent += 1
+        else:
+            self.failed += 1
+        if self._checkpoint_fp is None or not (
+            result.ok or isinstance(result.error, PERMANENT_ERRORS)
+        ):
+            return
+        entry: Dict[str, Any] = {"target": str(result.target)}
+        if result.message is not None:
+            entry["message_id"] = result.message.get("id")
+        if result.error is not None:
+            entry["error"] = str(result.error)
+        self._checkpoint_fp.write(json.dumps(entry) + "\n")
+        self._checkpoint_fp.flush()
+
+    def _body_for(self, target: int) -> bytes:
+        nonce = hashlib.blake2b(
+            str(target).encode(), digest_size=8, key=self._key
+        ).hexdigest()
+        extra = f'"nonce":"{nonce}","enforce_nonce":true}}'.encode()
+        body = self._encoded[:-1]
+        return body + (b"," + extra if body != b"{" else extra)
+
+    async def _send(self, target: int) -> BroadcastResult:
+        try:
+            channel_id = target
+            if self.dm:
+                channel = await self.http.create_dm(target)
+                channel_id = int(channel["id"])
+            message = await self.http.request(
+                "POST",
+                f"/channels/{channel_id}/messages",
+                body=self._body_for(target),
+                priority=self.priority,
+            )
+            return BroadcastResult(target, message=message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            return BroadcastResult(target, error=e)
+
+    async def _worker(self, queue: "asyncio.Queue[int]") -> None:
+        while True:
+            try:
+                target = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            result = await self._send(target)
+            self._record(result)
+            self._results.put_nowait(result)
+
+    def _start(self) -> None:
+        if self._workers:
+            return
+        if self.checkpoint:
+            self._checkpoint_fp = open(self.checkpoint, "a", encoding="utf-8")
+        queue: "asyncio.Queue[int]" = asyncio.Queue()
+        for target in self.targets:
+            queue.put_nowait(target)
+        workers = max(1, min(self.concurrency, len(self.targets)))
+        self._workers = [asyncio.create_task(self._worker(queue)) for _ in range(workers)]
+
+    async def __aiter__(self) -> AsyncIterator[BroadcastResult]:
+        self._start()
+        try:
+            for _ in range(len(self.targets)):
+                yield await self._results.get()
+        finally:
+            self.cancel()
+
+    async def run(self) -> List[BroadcastResult]:
+        return [result async for result in self]
+
+    def cancel(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        if self._checkpoint_fp is not None:
+            self._checkpoint_fp.close()
+            self._checkpoint_fp = None
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "targets": len(self.targets),
+            "skipped": self.skipped,
+            "sent": self.sent,
+            "failed": self.failed,
+        }
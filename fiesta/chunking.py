@@ -0,0 +1,102 @@
+from __future__ import annotations
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from .gateway import Gateway
+
+
+class MemberChunkIterator:
+    """Async iterator over GUILD_MEMBERS_CHUNK payloads.
+
+    One iterator can cover several op 8 requests (one per guild); chunks are
+    matched to it by nonce and yielded in arrival order until every request
+    has received its final chunk.
+    """
+
+    def __init__(self, gateway: "Gateway", payloads: List[Dict[str, Any]], timeout: float = 30.0):
+        self.gateway = gateway
+        self.timeout = timeout
+        self._payloads = payloads
+        self._remaining: Dict[str, int] = {}
+        self._received: Dict[str, int] = {}
+        self._queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+        self._started = False
+        self.not_found: List[Any] = []
+
+    @property
+    def nonces(self) -> List[str]:
+        return [payload["d"]["nonce"] for payload in self._payloads]
+
+    @property
+    def done(self) -> bool:
+        return self._started and not self._remaining and self._queue.empty()
+
+    async def _start(self) -> None:
+        self._started = True
+        for payload in self._payloads:
+            nonce = payload["d"]["nonce"]
+            self._remaining[nonce] = -1
+            self._received[nonce] = 0
+            self.gateway._chunk_requests[nonce] = self
+        for payload in self._payloads:
+            await self.gateway._send(payload)
+
+    def _feed(self, chunk: Dict[str, Any]) -> None:
+        nonce = chunk.get("nonce")
+        if nonce not in self._remaining:
+            return
+        self._received[nonce] += 1
+        if self._received[nonce] >= chunk.get("chunk_count", 1):
+            self._finish(nonce)
+        self.not_found.extend(chunk.get("not_found", []))
+        self._queue.put_nowait(chunk)
+
+    def _finish(self, nonce: str) -> None:
+        self._remaining.pop(nonce, None)
+        self.gateway._chunk_requests.pop(nonce, None)
+
+    def cancel(self) -> None:
+        for nonce in list(self._remaining):
+            self._finish(nonce)
+
+    def __aiter__(self) -> "MemberChunkIterator":
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        if not self._started:
+            await self._start()
+        if self.done:
+            raise StopAsyncIteration
+        try:
+            return await asyncio.wait_for(self._queue.get(), self.timeout)
+        except asyncio.TimeoutError:
+            self.cancel()
+            raise
+
+    async def flatten(self) -> List[Dict[str, Any]]:
+        members: List[Dict[str, Any]] = []
+        async for chunk in self:
+            members.extend(chunk.get("members", []))
+        return members
+
+
+def member_request_payload(
+    guild_id: int,
+    nonce: str,
+    query: Optional[str] = "",
+    limit: int = 0,
+    presences: bool = False,
+    user_ids: Optional[List[int]] = None,
+) -> Dict[str, Any]:
+    data: Dict[str, Any] = {
+        "guild_id": str(guild_id),
+        "limit": limit,
+        "presences": presences,
+        "nonce": nonce,
+    }
+    if user_ids:
+        data["user_ids"] = [str(user_id) for user_id in user_ids]
+    else:
+        data["query"] = query or ""
+    return {"op": 8, "d": data}
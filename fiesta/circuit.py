@@ -0,0 +1,129 @@
+from __future__ import annotations
+import time
+from collections import deque
+from typing import Any, Deque, Dict
+
+
+class CircuitBreaker:
+    """Fails requests fast after repeated server errors.
+
+    ``failure_threshold`` consecutive failures open the circuit. After
+    ``reset_timeout`` seconds it goes half-open and lets ``half_open_probes``
+    requests through; a successful probe closes it again, a failed one
+    reopens it for another timeout.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self, failure_threshold: int = 5, reset_timeout: float = 10.0, half_open_probes: int = 1
+    ):
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be >= 1.")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_at = 0.0
+        self.trips = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() >= self._opened_at + self.reset_timeout:
+            return self.HALF_OPEN
+        return self._state
+
+    @property
+    def retry_after(self) -> float:
+        if self._state != self.OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def allow(self) -> bool:
+        now = time.monotonic()
+        if self._state == self.OPEN:
+            if now < self._opened_at + self.reset_timeout:
+                return False
+            self._state = self.HALF_OPEN
+            self._probes = 0
+        if self._state == self.HALF_OPEN:
+            # A probe that never reported back (e.g. cancelled) must not
+            # wedge the breaker, so probe slots expire after a timeout.
+            if self._probes >= self.half_open_probes and now < self._probe_at + self.reset_timeout:
+                return False
+            if self._probes >= self.half_open_probes:
+                self._probes = 0
+            self._probes += 1
+            self._probe_at = now
+        return True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        if self._state == self.HALF_OPEN:
+            self._state = self.CLOSED
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._state == self.HALF_OPEN or (
+            self._state == self.CLOSED and self._failures >= self.failure_threshold
+        ):
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
+            self.trips += 1
+
+    def __repr__(self) -> str:
+        return f"<CircuitBreaker state={self.state} failures={self._failures}>"
+
+
+class RetryBudget:
+    """Caps retries at a fraction of recent successful requests.
+
+    Inside any ``window`` seconds at most ``ratio`` retries per success are
+    allowed, plus a floor of ``min_per_second`` so a quiet client can still
+    retry. During an outage successes dry up and so do retries.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_per_second: float = 1.0, window: float = 10.0):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.window = window
+        self._successes: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+        self.denied = 0
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self.window
+        for log in (self._successes, self._retries):
+            while log and log[0] <= cutoff:
+                log.popleft()
+
+    @property
+    def available(self) -> float:
+        self._expire(time.monotonic())
+        allowed = self.min_per_second * self.window + self.ratio * len(self._successes)
+        return max(0.0, allowed - len(self._retries))
+
+    def record_success(self) -> None:
+        self._successes.append(time.monotonic())
+
+    def try_acquire(self) -> bool:
+        if self.available < 1:
+            self.denied += 1
+            return False
+        self._retries.append(time.monotonic())
+        return True
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        self._expire(time.monotonic())
+        return {
+            "successes": len(self._successes),
+            "retries": len(self._retries),
+            "available": self.available,
+            "denied": self.denied,
+        }
@@ -1,15 +1,24 @@
 import asyncio
 import inspect
-from typing import Optional, Dict, Any, Callable, Union, Awaitable
+import aiohttp
+from typing import Optional, Dict, Any, Callable, List, Union, Awaitable, Tuple, TYPE_CHECKING
 
+from .cache import TTLCache
+from .coalesce import MessageCoalescer
+from .codec import get_codec
+from .dispatch import EventScheduler
 from .gateway import Gateway
-from .http import HTTPClient
+from .http import HTTPClient, PoolMonitor, create_connector
 from .intents import Intents
 from .commands import Command, Context
 from .interactions import Button, Select, Modal
-from .models import User
+from .models import Channel, Guild, Member, Role, User
+from .state import ConnectionState
 from .errors import LoginFailure
 
+if TYPE_CHECKING:
+    from .shard import IdentifyScheduler
+
 
 EventHandler = Union[Callable[..., Any], Callable[..., Awaitable[Any]]]
 
@@ -20,13 +29,47 @@ class Client:
         command_prefix: str = "!",
         intents: Union[str, Intents] = "default",
         case_insensitive: bool = True,
+        gateway_compress: Optional[str] = None,
+        json_codec: Optional[str] = None,
+        gateway_encoding: str = "json",
+        dispatch_concurrency: int = 64,
+        global_rate_limit: int = 50,
+        rest_cache_size: int = 0,
+        rest_cache_ttl: float = 60.0,
+        connection_limit: int = 100,
+        connection_limit_per_host: int = 0,
+        keepalive_timeout: float = 30.0,
+        dns_cache_ttl: Optional[int] = 300,
+        download_concurrency: int = 8,
+        coalesce_window: Optional[float] = None,
+        rest_proxy: Optional[str] = None,
+        cache_members: bool = True,
     ):
         self.command_prefix = command_prefix
         self.case_insensitive = case_insensitive
+        self.gateway_compress = gateway_compress
+        self.gateway_encoding = gateway_encoding
+        self._codec = get_codec(json_codec)
+        self.global_rate_limit = global_rate_limit
+        self.rest_cache_size = rest_cache_size
+        self.rest_cache_ttl = rest_cache_ttl
+        self.download_concurrency = download_concurrency
+        self.coalesce_window = coalesce_window
+        self.rest_proxy = rest_proxy
+        self._connector_options: Dict[str, Any] = {
+            "limit": connection_limit,
+            "limit_per_host": connection_limit_per_host,
+            "keepalive_timeout": keepalive_timeout,
+            "dns_cache_ttl": dns_cache_ttl,
+        }
+        self._scheduler = EventScheduler(
+            dispatch_concurrency, on_error=lambda e: self._dispatch("error", e)
+        )
         self.user: Optional[User] = None
-        self.guilds: Dict[int, Any] = {}
-        self.channels: Dict[int, Any] = {}
-        self.users: Dict[int, User] = {}
+        self._state = ConnectionState(cache_members=cache_members)
+        self.guilds: Dict[int, Guild] = self._state.guilds
+        self.channels: Dict[int, Channel] = self._state.channels
+        self.users: Dict[int, User] = self._state.users
 
         if isinstance(intents, str):
             self.intents = Intents.default() if intents == "default" else Intents.all()
@@ -35,7 +78,13 @@ class Client:
 
         self._http: Optional[HTTPClient] = None
         self._gateway: Optional[Gateway] = None
+        self._connector: Optional[aiohttp.TCPConnector] = None
+        self._gateway_connector: Optional[aiohttp.TCPConnector] = None
+        self._rest_pool = PoolMonitor()
+        self._gateway_pool = PoolMonitor()
+        self._coalescer: Optional[MessageCoalescer] = None
         self._events: Dict[str, list[EventHandler]] = {}
+        self._listened_events: set[str] = set()
         self._commands: Dict[str, Command] = {}
         self._buttons: Dict[str, Button] = {}
         self._selects: Dict[str, Select] = {}
@@ -44,6 +93,8 @@ class Client:
     def event(self, func: EventHandler) -> EventHandler:
         name = func.__name__
         self._events.setdefault(name, []).append(func)
+        if name.startswith("on_"):
+            self._listened_events.add(name[3:].upper())
         return func
 
     def command(
@@ -140,9 +191,103 @@ class Client:
             if custom_id in self._modals:
                 await self._modals[custom_id].callback(data)
 
+    def get_guild(self, guild_id: int) -> Optional[Guild]:
+        return self._state.get_guild(guild_id)
+
+    def get_channel(self, channel_id: int) -> Optional[Channel]:
+        return self._state.get_channel(channel_id)
+
+    def get_user(self, user_id: int) -> Optional[User]:
+        return self._state.get_user(user_id)
+
+    def get_role(self, role_id: int) -> Optional[Role]:
+        return self._state.get_role(role_id)
+
+    def get_member(self, guild_id: int, user_id: int) -> Optional[Member]:
+        return self._state.get_member(guild_id, user_id)
+
+    @property
+    def connector(self) -> aiohttp.TCPConnector:
+        # Created lazily so it binds to the running loop.
+        if self._connector is None or self._connector.closed:
+            self._connector = create_connector(**self._connector_options)
+        return self._connector
+
+    @property
+    def gateway_connector(self) -> aiohttp.TCPConnector:
+        # Websockets hold their connection for as long as they are open, so
+        # they get an unlimited pool of their own instead of REST slots.
+        if self._gateway_connector is None or self._gateway_connector.closed:
+            self._gateway_connector = create_connector(
+                limit=0,
+                keepalive_timeout=self._connector_options["keepalive_timeout"],
+                dns_cache_ttl=self._connector_options["dns_cache_ttl"],
+            )
+        return self._gateway_connector
+
+    @property
+    def coalescer(self) -> Optional[MessageCoalescer]:
+        # Opt-in: only exists when a coalesce_window was given.
+        if self.coalesce_window is None or self._http is None:
+            return None
+        if self._coalescer is None or self._coalescer.http is not self._http:
+            self._coalescer = MessageCoalescer(self._http, self.coalesce_window)
+        return self._coalescer
+
+    @property
+    def pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        # Each open websocket holds a gateway connection past its handshake.
+        sockets = sum(1 for gw in self._gateway_list if gw.ws is not None and not gw.ws.closed)
+        return {"rest": self._rest_pool.stats(), "gateway": self._gateway_pool.stats(held=sockets)}
+
+    @property
+    def _gateway_list(self) -> List[Gateway]:
+        return [self._gateway] if self._gateway else []
+
+    def _create_http(self, token: str) -> HTTPClient:
+        cache = (
+            TTLCache(self.rest_cache_size, self.rest_cache_ttl)
+            if self.rest_cache_size > 0
+            else None
+        )
+        proxy: Dict[str, Any] = {}
+        if self.rest_proxy and self.rest_proxy.startswith("unix:"):
+            proxy["unix_socket"] = self.rest_proxy[len("unix:") :]
+        elif self.rest_proxy:
+            proxy["base_url"] = f"{self.rest_proxy.rstrip('/')}/api/v10"
+        return HTTPClient(
+            token,
+            codec=self._codec,
+            global_rate=self.global_rate_limit,
+            cache=cache,
+            connector=self.connector,
+            download_concurrency=self.download_concurrency,
+            pool_monitor=self._rest_pool,
+            **proxy,
+        )
+
+    def _create_gateway(
+        self,
+        token: str,
+        shard: Optional[Tuple[int, int]] = None,
+        identify_scheduler: Optional["IdentifyScheduler"] = None,
+    ) -> Gateway:
+        return Gateway(
+            self,
+            token,
+            self.intents,
+            compress=self.gateway_compress,
+            codec=self._codec,
+            encoding=self.gateway_encoding,
+            shard=shard,
+            identify_scheduler=identify_scheduler,
+            connector=self.gateway_connector,
+            pool_monitor=self._gateway_pool,
+        )
+
     async def start(self, token: str) -> None:
-        self._http = HTTPClient(token)
-        self._gateway = Gateway(self, token, self.intents)
+        self._http = self._create_http(token)
+        self._gateway = self._create_gateway(token)
         try:
             await self._http.start()
             await self._gateway.connect()
@@ -155,13 +300,16 @@ class Client:
         except KeyboardInterrupt:
             pass
         finally:
-            if self._gateway and not self._gateway.closed:
-                asyncio.run(self._gateway.close())
-            if self._http and not self._http.closed:
-                asyncio.run(self._http.close())
+            asyncio.run(self.close())
 
     async def close(self) -> None:
         if self._gateway:
             await self._gateway.close()
+        await self._scheduler.close()
+        if self._coalescer:
+            await self._coalescer.close()
         if self._http:
             await self._http.close()
+        for connector in (self._connector, self._gateway_connector):
+            if connector and not connector.closed:
+                await connector.close()
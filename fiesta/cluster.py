@@ -0,0 +1,365 @@
+from __future__ import annotations
+import asyncio
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .codec import get_codec
+from .errors import ConnectionClosed, HTTPException
+from .http import HTTPClient
+from .shard import AutoShardedClient, IdentifyScheduler
+
+
+ClientFactory = Callable[..., AutoShardedClient]
+
+# Exit status of a worker that hit an error a restart cannot fix.
+FATAL_EXIT_CODE = 3
+
+
+def _is_fatal(error: Optional[BaseException]) -> bool:
+    # Bad credentials and fatal gateway close codes fail the same way on
+    # every restart, and each retry would burn a session start.
+    while error is not None:
+        if isinstance(error, ConnectionClosed):
+            return True
+        if isinstance(error, HTTPException) and error.status in (401, 403):
+            return True
+        error = error.__cause__
+    return False
+
+
+class IdentifyCoordinator:
+    """Serves one IdentifyScheduler to every worker over a unix socket.
+
+    The protocol is newline-delimited JSON. Workers send ``identify`` requests
+    and get an ``identify_ok`` reply once their bucket allows it, and they
+    push ``session`` updates so a restarted worker can resume its shards.
+    """
+
+    def __init__(self, scheduler: IdentifyScheduler, path: str):
+        self.scheduler = scheduler
+        self.path = path
+        self.sessions: Dict[int, Dict[str, Any]] = {}
+        self._codec = get_codec()
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self._server = await asyncio.start_unix_server(self._handle, path=self.path)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        tasks: List[asyncio.Task[None]] = []
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    message = self._codec.loads(line)
+                except ValueError:
+                    continue
+                op = message.get("op")
+                if op == "identify":
+                    tasks.append(asyncio.create_task(self._grant(message["shard_id"], writer)))
+                elif op == "session":
+                    self.sessions[message["shard_id"]] = message.get("state", {})
+        finally:
+            for task in tasks:
+                task.cancel()
+            writer.close()
+
+    async def _grant(self, shard_id: int, writer: asyncio.StreamWriter) -> None:
+        await self.scheduler.acquire(shard_id)
+        if writer.is_closing():
+            return
+        writer.write(self._codec.dumps_bytes({"op": "identify_ok", "shard_id": shard_id}) + b"\n")
+        await writer.drain()
+
+    def sessions_for(self, shard_ids: Sequence[int]) -> Dict[int, Dict[str, Any]]:
+        return {
+            shard_id: self.sessions[shard_id]
+            for shard_id in shard_ids
+            if shard_id in self.sessions and self.sessions[shard_id].get("session_id")
+        }
+
+    async def close(self) -> None:
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+
+class RemoteIdentifyScheduler(IdentifyScheduler):
+    """IdentifyScheduler proxy used inside worker processes"""
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self._codec = get_codec()
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task[None]] = None
+        self._waiters: Dict[int, asyncio.Future[None]] = {}
+        self._connect_lock: Optional[asyncio.Lock] = None
+
+    async def _ensure_connected(self) -> asyncio.StreamWriter:
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if self._writer is None or self._writer.is_closing():
+                self._reader, self._writer = await asyncio.open_unix_connection(self.path)
+                self._reader_task = asyncio.create_task(self._read_loop(self._reader))
+        return self._writer
+
+    async def _read_loop(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                message = self._codec.loads(line)
+                if message.get("op") == "identify_ok":
+                    waiter = self._waiters.pop(message["shard_id"], None)
+                    if waiter and not waiter.done():
+                        waiter.set_result(None)
+        finally:
+            for waiter in self._waiters.values():
+                if not waiter.done():
+                    waiter.set_exception(ConnectionError("Identify coordinator went away"))
+            self._waiters.clear()
+
+    async def _write(self, message: Dict[str, Any]) -> None:
+        writer = await self._ensure_connected()
+        writer.write(self._codec.dumps_bytes(message) + b"\n")
+        await writer.drain()
+
+    async def acquire(self, shard_id: int) -> None:
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[shard_id] = waiter
+        await self._write({"op": "identify", "shard_id": shard_id})
+        await waiter
+
+    async def report_session(self, shard_id: int, state: Dict[str, Any]) -> None:
+        await self._write({"op": "session", "shard_id": shard_id, "state": state})
+
+    async def close(self) -> None:
+        if self._reader_task:
+            self._reader_task.cancel()
+        if self._writer and not self._writer.is_closing():
+            self._writer.close()
+
+
+async def _report_sessions(
+    client: AutoShardedClient, scheduler: RemoteIdentifyScheduler, interval: float
+) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        for shard_id, gateway in client.shards.items():
+            state = gateway.session_state
+            if state.get("session_id"):
+                await scheduler.report_session(shard_id, state)
+
+
+async def _worker_main(
+    factory: ClientFactory,
+    token: str,
+    shard_ids: List[int],
+    shard_count: int,
+    socket_path: str,
+    sessions: Dict[int, Dict[str, Any]],
+    report_interval: float,
+) -> None:
+    scheduler = RemoteIdentifyScheduler(socket_path)
+    client = factory(
+        shard_ids=shard_ids,
+        shard_count=shard_count,
+        identify_scheduler=scheduler,
+        sessions=sessions,
+    )
+    reporter = asyncio.create_task(_report_sessions(client, scheduler, report_interval))
+    try:
+        await client.start(token)
+    finally:
+        reporter.cancel()
+        await client.close()
+        await scheduler.close()
+
+
+def _run_worker(*args: Any) -> None:
+    try:
+        asyncio.run(_worker_main(*args))
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        if _is_fatal(e):
+            sys.exit(FATAL_EXIT_CODE)
+        raise
+
+
+class ClusterLauncher:
+    """Runs shards across worker processes with a supervising parent.
+
+    ``client_factory`` is called in each worker with ``shard_ids``,
+    ``shard_count``, ``identify_scheduler`` and ``sessions`` keyword
+    arguments and must return an :class:`AutoShardedClient`. Workers are
+    started with ``spawn`` by default (forking a process that already runs
+    an event loop and resolver threads can deadlock), so the factory must be
+    picklable, e.g. a module-level function. Crashed workers are restarted
+    with exponential backoff, at most ``max_restarts`` times in a row; a
+    worker that exits with ``FATAL_EXIT_CODE`` is not restarted.
+    """
+
+    def __init__(
+        self,
+        client_factory: ClientFactory,
+        token: str,
+        workers: Optional[int] = None,
+        shard_count: Optional[int] = None,
+        socket_path: Optional[str] = None,
+        restart_delay: float = 5.0,
+        report_interval: float = 10.0,
+        start_method: str = "spawn",
+        max_restart_delay: float = 300.0,
+        max_restarts: Optional[int] = 10,
+    ):
+        self.client_factory = client_factory
+        self.token = token
+        self.workers = workers or os.cpu_count() or 1
+        self.shard_count = shard_count
+        self.socket_path = socket_path or os.path.join(
+            tempfile.gettempdir(), f"fiesta-cluster-{os.getpid()}.sock"
+        )
+        self.restart_delay = restart_delay
+        self.max_restart_delay = max_restart_delay
+        self.max_restarts = max_restarts
+        self.report_interval = report_interval
+
+        self._context = multiprocessing.get_context(start_method)
+        self._processes: Dict[int, Any] = {}
+        self._ranges: Dict[int, List[int]] = {}
+        self._started: Dict[int, float] = {}
+        self._restarts: Dict[int, int] = {}
+        self._restart_at: Dict[int, float] = {}
+        self.failed: Dict[int, Optional[int]] = {}
+        self._coordinator: Optional[IdentifyCoordinator] = None
+        self._closed = False
+
+    @staticmethod
+    def split_shards(shard_count: int, workers: int) -> List[List[int]]:
+        workers = max(1, min(workers, shard_count))
+        size, extra = divmod(shard_count, workers)
+        ranges: List[List[int]] = []
+        start = 0
+        for index in range(workers):
+            end = start + size + (1 if index < extra else 0)
+            ranges.append(list(range(start, end)))
+            start = end
+        return ranges
+
+    def _spawn(self, worker_id: int, sessions: Dict[int, Dict[str, Any]]) -> None:
+        process = self._context.Process(
+            target=_run_worker,
+            args=(
+                self.client_factory,
+                self.token,
+                self._ranges[worker_id],
+                self.shard_count,
+                self.socket_path,
+                sessions,
+                self.report_interval,
+            ),
+            name=f"fiesta-cluster-{worker_id}",
+            daemon=False,
+        )
+        process.start()
+        self._processes[worker_id] = process
+        self._started[worker_id] = time.monotonic()
+
+    async def _fetch_gateway_info(self) -> Dict[str, Any]:
+        http = HTTPClient(self.token)
+        try:
+            await http.start()
+            return await http.get_gateway_bot()
+        finally:
+            await http.close()
+
+    async def start(self) -> None:
+        info = await self._fetch_gateway_info()
+        if self.shard_count is None:
+            self.shard_count = int(info.get("shards", 1))
+        limits = info.get("session_start_limit", {})
+
+        scheduler = IdentifyScheduler(int(limits.get("max_concurrency", 1)))
+        self._coordinator = IdentifyCoordinator(scheduler, self.socket_path)
+        await self._coordinator.start()
+
+        for worker_id, shard_ids in enumerate(self.split_shards(self.shard_count, self.workers)):
+            self._ranges[worker_id] = shard_ids
+            self._spawn(worker_id, {})
+
+        try:
+            await self._supervise()
+        finally:
+            await self.close()
+
+    def _schedule_restart(self, worker_id: int, exitcode: Optional[int]) -> bool:
+        now = time.monotonic()
+        if now - self._started[worker_id] >= self.max_restart_delay:
+            self._restarts[worker_id] = 0  # It ran fine for a while
+        attempts = self._restarts.get(worker_id, 0)
+        if exitcode == FATAL_EXIT_CODE or (
+            self.max_restarts is not None and attempts >= self.max_restarts
+        ):
+            self.failed[worker_id] = exitcode
+            return False
+        self._restarts[worker_id] = attempts + 1
+        delay = min(self.max_restart_delay, self.restart_delay * 2**attempts)
+        self._restart_at[worker_id] = now + delay
+        return True
+
+    async def _supervise(self) -> None:
+        while not self._closed and self._processes:
+            await asyncio.sleep(1.0)
+            for worker_id, process in list(self._processes.items()):
+                if process.is_alive():
+                    continue
+                restart_at = self._restart_at.get(worker_id)
+                if restart_at is None:
+                    process.join()
+                    if process.exitcode == 0 or not self._schedule_restart(
+                        worker_id, process.exitcode
+                    ):
+                        del self._processes[worker_id]
+                    continue
+                if time.monotonic() < restart_at:
+                    continue
+                del self._restart_at[worker_id]
+                sessions = self._coordinator.sessions_for(self._ranges[worker_id])  # type: ignore
+                self._spawn(worker_id, sessions)
+
+    async def close(self) -> None:
+        self._closed = True
+        for process in self._processes.values():
+            if process.is_alive():
+                process.terminate()
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(None, process.join, 10)
+                for process in self._processes.values()
+            )
+        )
+        self._processes.clear()
+        if self._coordinator:
+            await self._coordinator.close()
+
+    def run(self) -> None:
+        try:
+            asyncio.run(self.start())
+        except KeyboardInterrupt:
+            pass
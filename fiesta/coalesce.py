@@ -0,0 +1,160 @@
+from __future__ import annotations
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .http import HTTPClient
+
+
+MAX_CONTENT_LENGTH = 2000
+MAX_EMBEDS = 10
+
+
+class _PendingSend(NamedTuple):
+    content: str
+    embeds: List[Dict[str, Any]]
+    future: "asyncio.Future[Dict[str, Any]]"
+
+
+class _PendingEdit:
+    __slots__ = ("fields", "futures")
+
+    def __init__(self) -> None:
+        self.fields: Dict[str, Any] = {}
+        self.futures: List["asyncio.Future[Dict[str, Any]]"] = []
+
+
+def pack_sends(items: List[_PendingSend]) -> List[List[_PendingSend]]:
+    """Group queued sends into as few messages as the content/embed limits allow"""
+    batches: List[List[_PendingSend]] = []
+    batch: List[_PendingSend] = []
+    length = 0
+    embeds = 0
+    for item in items:
+        extra = len(item.content) + (1 if length and item.content else 0)
+        if batch and (
+            length + extra > MAX_CONTENT_LENGTH or embeds + len(item.embeds) > MAX_EMBEDS
+        ):
+            batches.append(batch)
+            batch, length, embeds = [], 0, 0
+            extra = len(item.content)
+        batch.append(item)
+        length += extra
+        embeds += len(item.embeds)
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+class MessageCoalescer:
+    """Batches message sends per channel and collapses repeated edits.
+
+    Sends to one channel within ``window`` seconds are merged (content joined
+    by newlines) into as few messages as the 2000 character / 10 embed limits
+    allow; every caller gets the message that carried its text. Edits to the
+    same message are merged and only the latest state is sent.
+    """
+
+    def __init__(self, http: "HTTPClient", window: float = 0.5):
+        self.http = http
+        self.window = window
+        self._sends: Dict[int, List[_PendingSend]] = {}
+        self._send_tasks: Dict[int, asyncio.Task[None]] = {}
+        self._edits: Dict[Tuple[int, int], _PendingEdit] = {}
+        self._edit_tasks: Dict[Tuple[int, int], asyncio.Task[None]] = {}
+        self.stats: Dict[str, int] = {"sends": 0, "messages": 0, "edits": 0, "edit_requests": 0}
+
+    async def send(
+        self,
+        channel_id: int,
+        content: Optional[str] = None,
+        embeds: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        future: "asyncio.Future[Dict[str, Any]]" = asyncio.get_running_loop().create_future()
+        self._sends.setdefault(channel_id, []).append(
+            _PendingSend(content or "", list(embeds or ()), future)
+        )
+        self.stats["sends"] += 1
+        task = self._send_tasks.get(channel_id)
+        if task is None or task.done():
+            self._send_tasks[channel_id] = asyncio.create_task(self._flush_sends(channel_id))
+        return await future
+
+    async def _flush_sends(self, channel_id: int) -> None:
+        # One task per channel keeps its messages in order.
+        while self._sends.get(channel_id):
+            await asyncio.sleep(self.window)
+            items = self._sends.pop(channel_id, [])
+            for batch in pack_sends(items):
+                await self._send_batch(channel_id, batch)
+        self._send_tasks.pop(channel_id, None)
+
+    async def _send_batch(self, channel_id: int, batch: List[_PendingSend]) -> None:
+        content = "\n".join(item.content for item in batch if item.content)
+        embeds = [embed for item in batch for embed in item.embeds]
+        self.stats["messages"] += 1
+        try:
+            message = await self.http.send_message(
+                channel_id, content=content or None, embeds=embeds or None
+            )
+        except Exception as e:
+            for item in batch:
+                if not item.future.done():
+                    item.future.set_exception(e)
+            return
+        for item in batch:
+            if not item.future.done():
+                item.future.set_result(message)
+
+    async def edit(
+        self,
+        channel_id: int,
+        message_id: int,
+        content: Optional[str] = None,
+        embeds: Optional[List[Dict[str, Any]]] = None,
+        components: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        key = (channel_id, message_id)
+        pending = self._edits.get(key)
+        if pending is None:
+            pending = self._edits[key] = _PendingEdit()
+        if content is not None:
+            pending.fields["content"] = content
+        if embeds is not None:
+            pending.fields["embeds"] = embeds
+        if components is not None:
+            pending.fields["components"] = components
+        future: "asyncio.Future[Dict[str, Any]]" = asyncio.get_running_loop().create_future()
+        pending.futures.append(future)
+        self.stats["edits"] += 1
+        task = self._edit_tasks.get(key)
+        if task is None or task.done():
+            self._edit_tasks[key] = asyncio.create_task(self._flush_edits(key))
+        return await future
+
+    async def _flush_edits(self, key: Tuple[int, int]) -> None:
+        # Edits arriving while one is in flight are folded into the next one.
+        while key in self._edits:
+            await asyncio.sleep(self.window)
+            pending = self._edits.pop(key)
+            self.stats["edit_requests"] += 1
+            try:
+                message = await self.http.edit_message(*key, **pending.fields)
+            except Exception as e:
+                for future in pending.futures:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for future in pending.futures:
+                if not future.done():
+                    future.set_result(message)
+        self._edit_tasks.pop(key, None)
+
+    async def flush(self) -> None:
+        """Wait until everything queued so far has been sent"""
+        tasks = list(self._send_tasks.values()) + list(self._edit_tasks.values())
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def close(self) -> None:
+        await self.flush()
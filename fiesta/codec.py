@@ -0,0 +1,95 @@
+from __future__ import annotations
+import json
+from typing import Any, Dict, Optional, Type, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - optional speedup
+    ujson = None
+
+
+Payload = Union[str, bytes, bytearray, memoryview]
+
+
+class JSONCodec:
+    """Standard library JSON codec"""
+
+    name = "json"
+
+    def loads(self, data: Payload) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        return self.dumps(obj).encode("utf-8")
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} name='{self.name}'>"
+
+
+class OrjsonCodec(JSONCodec):
+    """orjson backed codec (decodes bytes without an intermediate str)"""
+
+    name = "orjson"
+
+    def loads(self, data: Payload) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+
+class UjsonCodec(JSONCodec):
+    """ujson backed codec"""
+
+    name = "ujson"
+
+    def loads(self, data: Payload) -> Any:
+        if isinstance(data, (bytearray, memoryview)):
+            data = bytes(data)
+        return ujson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False)
+
+
+CODECS: Dict[str, Type[JSONCodec]] = {
+    "orjson": OrjsonCodec,
+    "ujson": UjsonCodec,
+    "json": JSONCodec,
+}
+
+
+def _available(name: str) -> bool:
+    if name == "orjson":
+        return orjson is not None
+    if name == "ujson":
+        return ujson is not None
+    return name == "json"
+
+
+def get_codec(name: Optional[str] = None) -> JSONCodec:
+    """Return a JSON codec, picking the fastest installed one when no name is given"""
+    if name is None:
+        for candidate in CODECS:
+            if _available(candidate):
+                return CODECS[candidate]()
+        return JSONCodec()
+
+    if name not in CODECS:
+        raise ValueError(f"Unknown JSON codec '{name}'. Use one of {tuple(CODECS)}.")
+    if not _available(name):
+        raise RuntimeError(f"JSON codec '{name}' requested but the package is not installed.")
+    return CODECS[name]()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Any
+from ..file import File
 from ..models import User, Channel, Guild, Message
 from ..utils import create_embed
 
@@ -39,12 +40,20 @@ class Context:
         embeds: list[dict[str, Any]] | None = None,
         components: list[dict[str, Any]] | None = None,
         ephemeral: bool = False,
+        file: File | None = None,
+        files: list[File] | None = None,
     ) -> dict[str, Any]:
+        coalescer = self.client.coalescer
+        if coalescer is not None and not (components or file or files):
+            return await coalescer.send(
+                self.channel_id, content=content, embeds=embeds or ([embed] if embed else None)
+            )
         return await self.client._http.send_message(
             self.channel_id,
             content=content,
             embeds=embeds or ([embed] if embed else None),
             components=components,
+            files=files or ([file] if file else None),
         )
 
     async def reply(
@@ -0,0 +1,101 @@
+from __future__ import annotations
+import asyncio
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, Optional, Set, Tuple
+
+
+HandlerFactory = Callable[[], Awaitable[Any]]
+ErrorHandler = Callable[[Exception], Awaitable[Any]]
+
+
+class EventScheduler:
+    """Runs dispatch work concurrently while keeping per-key ordering.
+
+    Work submitted with the same key (for example a channel id) runs one item
+    at a time in submission order; work for different keys, or with no key,
+    runs in parallel on a pool of at most ``max_concurrency`` workers.
+    """
+
+    def __init__(self, max_concurrency: int = 64, on_error: Optional[ErrorHandler] = None):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1.")
+        self.max_concurrency = max_concurrency
+        self.on_error = on_error
+        # Keys with work waiting and no item running, plus unkeyed items
+        # (queued as ``(None, factory)``), in the order they became ready.
+        self._ready: Deque[Tuple[Optional[Hashable], Optional[HandlerFactory]]] = deque()
+        self._queues: Dict[Hashable, Deque[HandlerFactory]] = {}
+        self._workers: int = 0
+        self._tasks: Set[asyncio.Task[None]] = set()
+        self.running: int = 0
+
+    @property
+    def pending(self) -> int:
+        unkeyed = sum(1 for key, _ in self._ready if key is None)
+        return unkeyed + sum(len(queue) for queue in self._queues.values())
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "running": self.running,
+            "pending": self.pending,
+            "keys": len(self._queues),
+            "workers": self._workers,
+            "tasks": len(self._tasks),
+        }
+
+    def submit(self, key: Optional[Hashable], factory: HandlerFactory) -> None:
+        if key is None:
+            self._ready.append((None, factory))
+        else:
+            queue = self._queues.get(key)
+            if queue is not None:
+                # The key is already ready or running; it is re-queued when
+                # its current item finishes.
+                queue.append(factory)
+                return
+            self._queues[key] = deque((factory,))
+            self._ready.append((key, None))
+        if self._workers < self.max_concurrency:
+            self._workers += 1
+            self._spawn(self._work())
+
+    def _spawn(self, coro: Awaitable[None]) -> None:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _work(self) -> None:
+        try:
+            while self._ready:
+                key, factory = self._ready.popleft()
+                if key is None:
+                    await self._run(factory)  # type: ignore[arg-type]
+                    continue
+                queue = self._queues[key]
+                await self._run(queue.popleft())
+                if queue:
+                    self._ready.append((key, None))
+                else:
+                    del self._queues[key]
+        finally:
+            self._workers -= 1
+
+    async def _run(self, factory: HandlerFactory) -> None:
+        self.running += 1
+        try:
+            await factory()
+        except Exception as e:
+            if self.on_error:
+                await self.on_error(e)
+        finally:
+            self.running -= 1
+
+    async def close(self) -> None:
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._queues.clear()
+        self._ready.clear()
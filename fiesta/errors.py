@@ -44,6 +44,15 @@ class RateLimited(HTTPException):
         super().__init__(429, f"{message} (retry after {retry_after}s)", code)
 
 
+class CircuitOpen(FiestaException):
+    """Request rejected because its circuit breaker is open"""
+
+    def __init__(self, route: str, retry_after: float):
+        self.route: str = route
+        self.retry_after: float = retry_after
+        super().__init__(f"Circuit open for {route} (retry after {retry_after:.1f}s)")
+
+
 class ConnectionClosed(FiestaException):
     """WebSocket connection closed"""
 
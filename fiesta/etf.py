@@ -0,0 +1,299 @@
+from __future__ import annotations
+import struct
+import zlib
+from typing import Any, Callable, Dict, List, Union
+
+
+FORMAT_VERSION = 131
+
+NEW_FLOAT_EXT = 70
+COMPRESSED = 80
+SMALL_INTEGER_EXT = 97
+INTEGER_EXT = 98
+FLOAT_EXT = 99
+ATOM_EXT = 100
+SMALL_TUPLE_EXT = 104
+LARGE_TUPLE_EXT = 105
+NIL_EXT = 106
+STRING_EXT = 107
+LIST_EXT = 108
+BINARY_EXT = 109
+SMALL_BIG_EXT = 110
+LARGE_BIG_EXT = 111
+SMALL_ATOM_EXT = 115
+MAP_EXT = 116
+ATOM_UTF8_EXT = 118
+SMALL_ATOM_UTF8_EXT = 119
+
+_ATOMS: Dict[str, Any] = {"nil": None, "true": True, "false": False}
+
+_u16 = struct.Struct(">H")
+_u32 = struct.Struct(">I")
+_i32 = struct.Struct(">i")
+_f64 = struct.Struct(">d")
+
+
+class ETFDecodeError(ValueError):
+    """Malformed Erlang Term Format payload"""
+    pass
+
+
+class _Decoder:
+    __slots__ = ("data", "offset")
+
+    def __init__(self, data: Union[bytes, bytearray, memoryview]):
+        self.data = memoryview(data)
+        self.offset = 0
+
+    def decode(self) -> Any:
+        tag = self.data[self.offset]
+        self.offset += 1
+        handler = _DECODERS.get(tag)
+        if handler is None:
+            raise ETFDecodeError(f"Unsupported ETF tag {tag}")
+        return handler(self)
+
+    def _take(self, size: int) -> memoryview:
+        start = self.offset
+        end = start + size
+        if end > len(self.data):
+            raise ETFDecodeError("Unexpected end of ETF payload")
+        self.offset = end
+        return self.data[start:end]
+
+    def _atom(self, size: int, encoding: str) -> Any:
+        name = str(self._take(size), encoding)
+        return _ATOMS.get(name, name)
+
+    def small_integer(self) -> int:
+        value = self.data[self.offset]
+        self.offset += 1
+        return value
+
+    def integer(self) -> int:
+        (value,) = _i32.unpack_from(self.data, self.offset)
+        self.offset += 4
+        return value
+
+    def new_float(self) -> float:
+        (value,) = _f64.unpack_from(self.data, self.offset)
+        self.offset += 8
+        return value
+
+    def float(self) -> float:
+        return float(bytes(self._take(31)).rstrip(b"\x00"))
+
+    def atom(self) -> Any:
+        (size,) = _u16.unpack_from(self.data, self.offset)
+        self.offset += 2
+        return self._atom(size, "latin-1")
+
+    def small_atom(self) -> Any:
+        size = self.data[self.offset]
+        self.offset += 1
+        return self._atom(size, "latin-1")
+
+    def atom_utf8(self) -> Any:
+        (size,) = _u16.unpack_from(self.data, self.offset)
+        self.offset += 2
+        return self._atom(size, "utf-8")
+
+    def small_atom_utf8(self) -> Any:
+        size = self.data[self.offset]
+        self.offset += 1
+        return self._atom(size, "utf-8")
+
+    def small_tuple(self) -> List[Any]:
+        arity = self.data[self.offset]
+        self.offset += 1
+        return [self.decode() for _ in range(arity)]
+
+    def large_tuple(self) -> List[Any]:
+        (arity,) = _u32.unpack_from(self.data, self.offset)
+        self.offset += 4
+        return [self.decode() for _ in range(arity)]
+
+    def nil(self) -> List[Any]:
+        return []
+
+    def string(self) -> List[int]:
+        # STRING_EXT is Erlang's compact form for lists of small integers.
+        (size,) = _u16.unpack_from(self.data, self.offset)
+        self.offset += 2
+        return list(self._take(size))
+
+    def list(self) -> List[Any]:
+        (size,) = _u32.unpack_from(self.data, self.offset)
+        self.offset += 4
+        items = [self.decode() for _ in range(size)]
+        tail = self.decode()
+        if tail != []:
+            items.append(tail)
+        return items
+
+    def binary(self) -> str:
+        (size,) = _u32.unpack_from(self.data, self.offset)
+        self.offset += 4
+        raw = self._take(size)
+        try:
+            return str(raw, "utf-8")
+        except UnicodeDecodeError:
+            return str(raw, "latin-1")
+
+    def _big(self, size: int) -> int:
+        sign = self.data[self.offset]
+        self.offset += 1
+        value = int.from_bytes(self._take(size), "little")
+        return -value if sign else value
+
+    def small_big(self) -> int:
+        size = self.data[self.offset]
+        self.offset += 1
+        return self._big(size)
+
+    def large_big(self) -> int:
+        (size,) = _u32.unpack_from(self.data, self.offset)
+        self.offset += 4
+        return self._big(size)
+
+    def map(self) -> Dict[Any, Any]:
+        (arity,) = _u32.unpack_from(self.data, self.offset)
+        self.offset += 4
+        result: Dict[Any, Any] = {}
+        decode = self.decode
+        for _ in range(arity):
+            key = decode()
+            result[key] = decode()
+        return result
+
+    def compressed(self) -> Any:
+        (size,) = _u32.unpack_from(self.data, self.offset)
+        self.offset += 4
+        inflated = zlib.decompress(self.data[self.offset :])
+        if len(inflated) != size:
+            raise ETFDecodeError("Compressed ETF term has an unexpected size")
+        self.offset = len(self.data)
+        return _Decoder(inflated).decode()
+
+
+_DECODERS: Dict[int, Callable[[_Decoder], Any]] = {
+    NEW_FLOAT_EXT: _Decoder.new_float,
+    COMPRESSED: _Decoder.compressed,
+    SMALL_INTEGER_EXT: _Decoder.small_integer,
+    INTEGER_EXT: _Decoder.integer,
+    FLOAT_EXT: _Decoder.float,
+    ATOM_EXT: _Decoder.atom,
+    SMALL_TUPLE_EXT: _Decoder.small_tuple,
+    LARGE_TUPLE_EXT: _Decoder.large_tuple,
+    NIL_EXT: _Decoder.nil,
+    STRING_EXT: _Decoder.string,
+    LIST_EXT: _Decoder.list,
+    BINARY_EXT: _Decoder.binary,
+    SMALL_BIG_EXT: _Decoder.small_big,
+    LARGE_BIG_EXT: _Decoder.large_big,
+    SMALL_ATOM_EXT: _Decoder.small_atom,
+    MAP_EXT: _Decoder.map,
+    ATOM_UTF8_EXT: _Decoder.atom_utf8,
+    SMALL_ATOM_UTF8_EXT: _Decoder.small_atom_utf8,
+}
+
+
+def _encode_atom(name: str, out: bytearray) -> None:
+    raw = name.encode("utf-8")
+    out.append(SMALL_ATOM_UTF8_EXT)
+    out.append(len(raw))
+    out += raw
+
+
+def _encode(obj: Any, out: bytearray) -> None:
+    if obj is None:
+        _encode_atom("nil", out)
+    elif obj is True:
+        _encode_atom("true", out)
+    elif obj is False:
+        _encode_atom("false", out)
+    elif isinstance(obj, int):
+        if 0 <= obj <= 255:
+            out.append(SMALL_INTEGER_EXT)
+            out.append(obj)
+        elif -(2**31) <= obj < 2**31:
+            out.append(INTEGER_EXT)
+            out += _i32.pack(obj)
+        else:
+            magnitude = abs(obj)
+            digits = magnitude.to_bytes((magnitude.bit_length() + 7) // 8, "little")
+            if len(digits) > 255:
+                out.append(LARGE_BIG_EXT)
+                out += _u32.pack(len(digits))
+            else:
+                out.append(SMALL_BIG_EXT)
+                out.append(len(digits))
+            out.append(1 if obj < 0 else 0)
+            out += digits
+    elif isinstance(obj, float):
+        out.append(NEW_FLOAT_EXT)
+        out += _f64.pack(obj)
+    elif isinstance(obj, str):
+        raw = obj.encode("utf-8")
+        out.append(BINARY_EXT)
+        out += _u32.pack(len(raw))
+        out += raw
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        out.append(BINARY_EXT)
+        out += _u32.pack(len(obj))
+        out += obj
+    elif isinstance(obj, dict):
+        out.append(MAP_EXT)
+        out += _u32.pack(len(obj))
+        for key, value in obj.items():
+            _encode(key, out)
+            _encode(value, out)
+    elif isinstance(obj, (list, tuple)):
+        if not obj:
+            out.append(NIL_EXT)
+            return
+        out.append(LIST_EXT)
+        out += _u32.pack(len(obj))
+        for item in obj:
+            _encode(item, out)
+        out.append(NIL_EXT)
+    else:
+        raise TypeError(f"Object of type {type(obj).__name__} is not ETF serializable")
+
+
+def loads(data: Union[bytes, bytearray, memoryview]) -> Any:
+    """Decode an Erlang Term Format payload"""
+    if not data or data[0] != FORMAT_VERSION:
+        raise ETFDecodeError("Invalid ETF version byte")
+    decoder = _Decoder(data)
+    decoder.offset = 1
+    try:
+        return decoder.decode()
+    except (IndexError, struct.error) as e:
+        raise ETFDecodeError(f"Truncated ETF payload: {e}") from e
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode an object as an Erlang Term Format payload"""
+    out = bytearray((FORMAT_VERSION,))
+    _encode(obj, out)
+    return bytes(out)
+
+
+class ETFCodec:
+    """Erlang Term Format codec for the gateway (``encoding=etf``)"""
+
+    name = "etf"
+
+    def loads(self, data: Union[bytes, bytearray, memoryview]) -> Any:
+        return loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return dumps(obj)
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        return dumps(obj)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} name='{self.name}'>"
+
@@ -0,0 +1,142 @@
+from __future__ import annotations
+import asyncio
+import io
+import mimetypes
+import os
+from typing import Any, AsyncIterator, BinaryIO, Optional, Union
+
+from aiohttp import payload
+
+
+FileSource = Union[str, "os.PathLike[str]", BinaryIO, bytes, bytearray, memoryview]
+
+
+class File:
+    """Attachment streamed in chunks from a path, a binary file object or a buffer"""
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        fp: FileSource,
+        filename: Optional[str] = None,
+        *,
+        spoiler: bool = False,
+        description: Optional[str] = None,
+        content_type: Optional[str] = None,
+        chunk_size: int = CHUNK_SIZE,
+    ):
+        self._path: Optional[str] = None
+        self._buffer: Optional[memoryview] = None
+        self._fp: Optional[BinaryIO] = None
+        self._owns_fp = False
+        self._start = 0
+        self._consumed = False
+
+        if isinstance(fp, (str, os.PathLike)):
+            self._path = os.fspath(fp)
+            filename = filename or os.path.basename(self._path)
+        elif isinstance(fp, (bytes, bytearray, memoryview)):
+            self._buffer = memoryview(fp).cast("B")
+        else:
+            if not fp.readable():
+                raise ValueError(f"File object {fp!r} is not readable.")
+            self._fp = fp
+            self._start = fp.tell() if fp.seekable() else 0
+            name = getattr(fp, "name", None)
+            if not filename and isinstance(name, str):
+                filename = os.path.basename(name)
+
+        filename = filename or "untitled"
+        if spoiler and not filename.startswith("SPOILER_"):
+            filename = f"SPOILER_{filename}"
+        self.filename = filename
+        self.description = description
+        self.content_type = (
+            content_type or mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        )
+        self.chunk_size = chunk_size
+
+    @property
+    def spoiler(self) -> bool:
+        return self.filename.startswith("SPOILER_")
+
+    @property
+    def size(self) -> Optional[int]:
+        if self._buffer is not None:
+            return self._buffer.nbytes
+        if self._path is not None:
+            return os.path.getsize(self._path)
+        fp = self._fp
+        if fp is None or not fp.seekable():
+            return None
+        position = fp.tell()
+        end = fp.seek(0, io.SEEK_END)
+        fp.seek(position)
+        return end - self._start
+
+    def _open(self) -> BinaryIO:
+        if self._fp is None:
+            self._fp = open(self._path, "rb")  # type: ignore[arg-type]
+            self._owns_fp = True
+        return self._fp
+
+    def reset(self) -> None:
+        if self._fp is None or not self._consumed:
+            return
+        if not self._fp.seekable():
+            raise ValueError(f"Cannot rewind non-seekable file '{self.filename}'.")
+        self._fp.seek(self._start)
+        self._consumed = False
+
+    async def iter_chunks(self) -> AsyncIterator[Union[bytes, memoryview]]:
+        if self._buffer is not None:
+            for offset in range(0, self._buffer.nbytes, self.chunk_size):
+                yield self._buffer[offset : offset + self.chunk_size]
+            return
+
+        loop = asyncio.get_running_loop()
+        fp = await loop.run_in_executor(None, self._open)
+        self._consumed = True
+        while True:
+            chunk = await loop.run_in_executor(None, fp.read, self.chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+    def to_payload(self) -> "FilePayload":
+        return FilePayload(self)
+
+    def to_attachment(self, index: int) -> dict[str, Any]:
+        attachment: dict[str, Any] = {"id": index, "filename": self.filename}
+        if self.description:
+            attachment["description"] = self.description
+        return attachment
+
+    def close(self) -> None:
+        if self._owns_fp and self._fp is not None:
+            self._fp.close()
+            self._fp = None
+            self._owns_fp = False
+            self._consumed = False
+
+    def __repr__(self) -> str:
+        return f"<File filename='{self.filename}' size={self.size}>"
+
+
+class FilePayload(payload.Payload):
+    """aiohttp payload that writes a File chunk by chunk without closing it"""
+
+    def __init__(self, file: File, **kwargs: Any):
+        super().__init__(
+            file, content_type=file.content_type, filename=file.filename, **kwargs
+        )
+        self._file = file
+        self._size = file.size
+
+    async def write(self, writer: Any) -> None:
+        async for chunk in self._file.iter_chunks():
+            await writer.write(chunk)
+
+    def decode(self, encoding: str = "utf-8", errors: str = "strict") -> str:
+        raise TypeError("File payloads are streamed and cannot be decoded to text.")
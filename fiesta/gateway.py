@@ -1,23 +1,104 @@
 import asyncio
-import json
-from typing import Optional, TYPE_CHECKING, Any
+import random
+import re
+import uuid
+import zlib
+from collections import deque
+from typing import Optional, TYPE_CHECKING, Any, Deque, Iterable, Tuple, Union
 
 import aiohttp
 
+from .chunking import MemberChunkIterator, member_request_payload
+from .codec import JSONCodec, get_codec
+from .etf import ETFCodec
 from .intents import Intents
 from .errors import ConnectionClosed, GatewayError
+from .ratelimit import TokenBucket
 
 if TYPE_CHECKING:
     from .client import Client
+    from .http import PoolMonitor
+    from .shard import IdentifyScheduler
+
+
+ZLIB_SUFFIX = b"\x00\x00\xff\xff"
+
+# Close codes after which Discord will not accept a new session either.
+FATAL_CLOSE_CODES = frozenset({4004, 4010, 4011, 4012, 4013, 4014})
+# Close codes that invalidate the session but allow a fresh IDENTIFY.
+NON_RESUMABLE_CLOSE_CODES = frozenset({1000, 4007, 4009})
+
+
+# Matches the top-level "t", "s" and "op" keys that precede "d" in dispatch frames.
+_FRAME_HEADER = re.compile(r'"(t|s|op)":\s*(?:"([A-Z_]+)"|(\d+)|null)')
+
+
+class _ReconnectWebSocket(Exception):
+    def __init__(self, resume: bool):
+        self.resume = resume
+        super().__init__(f"Gateway requested reconnect (resume={resume})")
 
 
 class Gateway:
-    GATEWAY_URL = "wss://gateway.discord.gg/?v=10&encoding=json"
+    GATEWAY_URL = "wss://gateway.discord.gg/?v=10"
+    MAX_BACKOFF = 60.0
+    # Failed handshakes against resume_gateway_url before falling back to
+    # the main gateway URL (the session itself is still resumed).
+    RESUME_URL_ATTEMPTS = 3
+    # Discord allows 120 gateway commands per 60s per connection; part of that
+    # budget is held back so heartbeats and identify/resume always get through.
+    SEND_LIMIT = 120
+    SEND_WINDOW = 60.0
+    SEND_RESERVE = 5
+    PRIORITY_OPS = frozenset({1, 2, 6})
+    # Dispatch events the library itself consumes, regardless of listeners.
+    # Entity cache events come from ConnectionState.events.
+    INTERNAL_EVENTS = frozenset(
+        {"READY", "RESUMED", "MESSAGE_CREATE", "INTERACTION_CREATE", "GUILD_MEMBERS_CHUNK"}
+    )
+    # Events that make cached REST responses stale, mapped to the endpoint
+    # prefix and the payload key holding the id.
+    CACHE_INVALIDATIONS = {
+        "GUILD_UPDATE": ("guilds", "id"),
+        "GUILD_DELETE": ("guilds", "id"),
+        "CHANNEL_UPDATE": ("channels", "id"),
+        "CHANNEL_DELETE": ("channels", "id"),
+        "THREAD_UPDATE": ("channels", "id"),
+        "THREAD_DELETE": ("channels", "id"),
+        "USER_UPDATE": ("users", "id"),
+    }
+    COMPRESSION_MODES = ("zlib-stream",)
+    ENCODINGS = ("json", "etf")
 
-    def __init__(self, client: "Client", token: str, intents: Intents):
+    def __init__(
+        self,
+        client: "Client",
+        token: str,
+        intents: Intents,
+        compress: Optional[str] = None,
+        codec: Optional[JSONCodec] = None,
+        encoding: str = "json",
+        shard: Optional[Tuple[int, int]] = None,
+        identify_scheduler: Optional["IdentifyScheduler"] = None,
+        connector: Optional[aiohttp.BaseConnector] = None,
+        pool_monitor: Optional["PoolMonitor"] = None,
+    ):
+        if encoding not in self.ENCODINGS:
+            raise ValueError(f"Invalid encoding '{encoding}'. Use one of {self.ENCODINGS}.")
+        if compress is not None and compress not in self.COMPRESSION_MODES:
+            raise ValueError(
+                f"Invalid compress mode '{compress}'. Use one of {self.COMPRESSION_MODES}."
+            )
         self.client = client
         self.token = token
         self.intents = intents
+        self.compress = compress
+        self.encoding = encoding
+        self.codec: Any = ETFCodec() if encoding == "etf" else codec or get_codec()
+        self.shard = shard
+        self.identify_scheduler = identify_scheduler
+        self.connector = connector
+        self.pool_monitor = pool_monitor
 
         self.ws: Optional[aiohttp.ClientWebSocketResponse] = None
         self.session: Optional[aiohttp.ClientSession] = None
@@ -25,31 +106,216 @@ class Gateway:
 
         self._sequence: Optional[int] = None
         self._session_id: Optional[str] = None
+        self._resume_url: Optional[str] = None
         self._heartbeat_interval: float = 0
         self._acknowledged: bool = True
+        self._established: bool = False
+
+        self._inflator: Optional[Any] = None
+        self._zlib_buffer = bytearray()
+
+        self._send_limiter = TokenBucket(self.SEND_LIMIT, self.SEND_WINDOW)
+        self._send_queue: Deque[dict[str, Any]] = deque()
+        self._send_ready = asyncio.Event()
+        self._send_task: Optional[asyncio.Task[None]] = None
+        self._pending_presence: Optional[dict[str, Any]] = None
+        self._send_stats: dict[str, int] = {"sent": 0, "queued": 0, "coalesced": 0}
+        self._chunk_requests: dict[str, MemberChunkIterator] = {}
+        self.skipped_events: int = 0
+        self._internal_events = self.INTERNAL_EVENTS | client._state.events
 
         self.closed: bool = False
 
+    @property
+    def shard_id(self) -> int:
+        return self.shard[0] if self.shard else 0
+
+    @property
+    def session_state(self) -> dict[str, Any]:
+        return {
+            "session_id": self._session_id,
+            "sequence": self._sequence,
+            "resume_url": self._resume_url,
+        }
+
+    def restore_session(self, state: dict[str, Any]) -> None:
+        self._session_id = state.get("session_id")
+        self._sequence = state.get("sequence")
+        self._resume_url = state.get("resume_url")
+
+    @property
+    def _rest_cache_enabled(self) -> bool:
+        http = self.client._http
+        return http is not None and http.cache is not None
+
+    @property
+    def url(self) -> str:
+        return self._build_url(self.GATEWAY_URL)
+
+    def _build_url(self, base: str) -> str:
+        if "?" not in base:
+            base = f"{base.rstrip('/')}/?v=10"
+        url = f"{base}&encoding={self.encoding}"
+        if self.compress:
+            url += f"&compress={self.compress}"
+        return url
+
+    def _invalidate_session(self) -> None:
+        self._session_id = None
+        self._sequence = None
+        self._resume_url = None
+
+    def _backoff(self, attempt: int) -> float:
+        # Full jitter keeps a fleet of shards from reconnecting in lockstep.
+        return random.uniform(0, min(self.MAX_BACKOFF, 2.0**attempt))
+
     async def connect(self, resume: bool = False):
-        self.session = aiohttp.ClientSession()
-        try:
-            self.ws = await self.session.ws_connect(self.GATEWAY_URL, heartbeat=None)
-            await self._handle_connection(resume)
-        except Exception as e:
-            raise GatewayError(f"Failed to connect to gateway: {e}") from e
+        self.closed = False
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=self.connector,
+                connector_owner=self.connector is None,
+                trace_configs=[self.pool_monitor.trace_config] if self.pool_monitor else None,
+            )
+
+        attempt = 0
+        resume_url_failures = 0
+        connected = False
+        while not self.closed:
+            close_code: Optional[int] = None
+            self._established = False
+            using_resume_url = False
+            try:
+                resuming = resume and self._session_id is not None
+                url = self.url
+                if resuming and self._resume_url:
+                    url = self._build_url(self._resume_url)
+                    using_resume_url = True
+                if not resuming and self.identify_scheduler is not None:
+                    # Wait for the identify slot before opening the socket; a
+                    # shard parked on an open connection would miss heartbeats.
+                    await self.identify_scheduler.acquire(self.shard_id)
+                self._reset_inflator()
+                self._send_limiter.reset()
+                self.ws = await self.session.ws_connect(url, heartbeat=None)
+                connected = True
+                await self._handle_connection(resuming)
+                close_code = self.ws.close_code
+                resume = close_code not in NON_RESUMABLE_CLOSE_CODES
+            except _ReconnectWebSocket as e:
+                resume = e.resume
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+                if not connected and not using_resume_url:
+                    raise GatewayError(f"Failed to connect to gateway: {e}") from e
+                self._report_error(e)
+                if using_resume_url and not self._established:
+                    resume_url_failures += 1
+                    if resume_url_failures >= self.RESUME_URL_ATTEMPTS:
+                        self._resume_url = None
+                resume = True
+            except Exception as e:
+                # A corrupt frame or a failure while applying an event costs
+                # this socket, not the client: report it and resume on a
+                # fresh socket (and inflator).
+                self._report_error(e)
+                resume = True
+            finally:
+                self._stop_heartbeat()
+                self._stop_sender()
+                if self.ws and not self.ws.closed:
+                    await self.ws.close(code=4000)
+
+            if self.closed:
+                break
+            if close_code in FATAL_CLOSE_CODES:
+                self.closed = True
+                raise ConnectionClosed(close_code, "Gateway refused the session")
+            if not resume:
+                self._invalidate_session()
+
+            if self._established:
+                attempt = 0
+                resume_url_failures = 0
+            await asyncio.sleep(self._backoff(attempt))
+            attempt += 1
+
+        if self.session and not self.session.closed:
+            await self.session.close()
+
+    def _report_error(self, error: Exception) -> None:
+        self.client._scheduler.submit(None, lambda: self.client._dispatch("error", error))
 
     async def _handle_connection(self, resume: bool = False):
         async for msg in self.ws:  # type: ignore
             if msg.type == aiohttp.WSMsgType.TEXT:
+                if self._skip_unwanted(msg.data):
+                    continue
+                try:
+                    data: dict[str, Any] = self.codec.loads(msg.data)
+                except ValueError:
+                    continue
+                await self._handle_event(data, resume)
+            elif msg.type == aiohttp.WSMsgType.BINARY:
+                raw = self._decompress(msg.data)
+                if raw is None or self._skip_unwanted(raw):
+                    continue
                 try:
-                    data: dict[str, Any] = json.loads(msg.data)
-                except json.JSONDecodeError:
+                    data = self.codec.loads(raw)
+                except ValueError:
                     continue
                 await self._handle_event(data, resume)
-            elif msg.type == aiohttp.WSMsgType.CLOSED:
-                raise ConnectionClosed("Gateway closed by server")
             elif msg.type == aiohttp.WSMsgType.ERROR:
-                raise ConnectionClosed("Gateway connection lost")
+                break
+
+    def _skip_unwanted(self, frame: Union[str, bytes]) -> bool:
+        # Reads op/t/s from the frame header without decoding the payload and
+        # drops dispatches nobody listens to. Anything unusual falls back to a
+        # full decode.
+        if self.encoding != "json":
+            return False
+        if isinstance(frame, str):
+            end = frame.find('"d":')
+            header = frame[:end]
+        else:
+            end = frame.find(b'"d":')
+            header = frame[:end].decode("latin-1")
+        if end < 0:
+            return False
+
+        fields: dict[str, str] = {}
+        for match in _FRAME_HEADER.finditer(header):
+            fields[match.group(1)] = match.group(2) or match.group(3)
+        event_type = fields.get("t")
+        seq = fields.get("s")
+        if fields.get("op") != "0" or not event_type or not seq:
+            return False
+        if event_type in self._internal_events or event_type in self.client._listened_events:
+            return False
+        if event_type in self.CACHE_INVALIDATIONS and self._rest_cache_enabled:
+            return False
+
+        self._sequence = int(seq)
+        self.skipped_events += 1
+        return True
+
+    def _reset_inflator(self) -> None:
+        # zlib-stream shares one compression context for the whole connection,
+        # so a fresh socket always needs a fresh inflator.
+        self._zlib_buffer.clear()
+        self._inflator = zlib.decompressobj() if self.compress == "zlib-stream" else None
+
+    def _decompress(self, chunk: bytes) -> Optional[bytes]:
+        if self._inflator is None:
+            return chunk
+        self._zlib_buffer.extend(chunk)
+        if self._zlib_buffer[-4:] != ZLIB_SUFFIX:
+            return None
+        try:
+            return self._inflator.decompress(self._zlib_buffer)
+        except zlib.error as e:
+            raise GatewayError(f"Failed to decompress gateway payload: {e}") from e
+        finally:
+            self._zlib_buffer.clear()
 
     async def _handle_event(self, data: dict, resume: bool):
         op = data.get("op")
@@ -62,28 +328,55 @@ class Gateway:
 
         if op == 10:  # Hello
             self._heartbeat_interval = event_data["heartbeat_interval"] / 1000.0
+            self._stop_heartbeat()
+            self._acknowledged = True
+            self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
             if resume and self._session_id:
                 await self._resume()
             else:
                 await self._identify()
-            self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
 
         elif op == 11:  # Heartbeat ACK
             self._acknowledged = True
 
+        elif op == 1:  # Heartbeat request
+            await self._send({"op": 1, "d": self._sequence})
+
         elif op == 0 and event_type:  # Dispatch
             if event_type == "READY":
                 self._session_id = event_data.get("session_id")
-            await self._dispatch_event(event_type, event_data)
+                self._resume_url = event_data.get("resume_gateway_url")
+            if event_type in ("READY", "RESUMED"):
+                self._established = True
+                self._start_sender()
+            elif event_type == "GUILD_MEMBERS_CHUNK":
+                request = self._chunk_requests.get(event_data.get("nonce"))
+                if request is not None:
+                    request._feed(event_data)
+            elif event_type in self.CACHE_INVALIDATIONS and self._rest_cache_enabled:
+                prefix, id_key = self.CACHE_INVALIDATIONS[event_type]
+                self.client._http.invalidate(f"{prefix}/{event_data.get(id_key)}")  # type: ignore[union-attr]
+                if event_type == "USER_UPDATE":
+                    self.client._http.invalidate("users/@me")  # type: ignore[union-attr]
+            # The entity cache is updated here, in gateway order, so handlers
+            # scheduled below always observe state at least this new.
+            self.client._state.apply(event_type, event_data)
+            if event_type == "READY":
+                # The cached object, so USER_UPDATE keeps client.user current.
+                self.client.user = self.client.get_user(int(event_data["user"]["id"]))
+            # Handlers run off the read loop so a slow command cannot stall
+            # heartbeat ACKs; events sharing a channel/guild stay ordered.
+            self.client._scheduler.submit(
+                self._dispatch_key(event_data),
+                lambda: self._dispatch_event(event_type, event_data),
+            )
 
         elif op == 7:  # Reconnect request
-            await self.close()
-            await asyncio.sleep(2)
-            await self.connect(resume=True)
+            raise _ReconnectWebSocket(resume=True)
 
-        elif op == 9:  # Invalid Session
-            await asyncio.sleep(5)
-            await self.connect(resume=False)
+        elif op == 9:  # Invalid Session, d tells whether it is resumable
+            await asyncio.sleep(random.uniform(1, 5))
+            raise _ReconnectWebSocket(resume=bool(event_data))
 
     async def _identify(self):
         payload = {
@@ -98,6 +391,8 @@ class Gateway:
                 },
             },
         }
+        if self.shard is not None:
+            payload["d"]["shard"] = list(self.shard)
         await self._send(payload)
 
     async def _resume(self):
@@ -116,24 +411,140 @@ class Gateway:
             while True:
                 await asyncio.sleep(self._heartbeat_interval)
                 if not self._acknowledged:
-                    await self.close()
+                    # Zombied connection: drop the socket with a non-1000 code
+                    # so the session stays resumable.
+                    if self.ws and not self.ws.closed:
+                        await self.ws.close(code=4000)
                     break
                 self._acknowledged = False
                 await self._send({"op": 1, "d": self._sequence})
         except asyncio.CancelledError:
             return
 
+    def _stop_heartbeat(self) -> None:
+        if self._heartbeat_task and not self._heartbeat_task.done():
+            self._heartbeat_task.cancel()
+        self._heartbeat_task = None
+
+    @property
+    def send_stats(self) -> dict[str, int]:
+        return {
+            **self._send_stats,
+            "queue_depth": len(self._send_queue),
+            "available": self._send_limiter.available,
+        }
+
+    def _start_sender(self) -> None:
+        if self._send_task is None or self._send_task.done():
+            self._send_task = asyncio.create_task(self._send_loop())
+
+    def _stop_sender(self) -> None:
+        if self._send_task and not self._send_task.done():
+            self._send_task.cancel()
+        self._send_task = None
+
+    async def _send_loop(self):
+        try:
+            while True:
+                while not self._send_queue:
+                    self._send_ready.clear()
+                    await self._send_ready.wait()
+                await self._send_limiter.acquire(reserve=self.SEND_RESERVE)
+                payload = self._send_queue.popleft()
+                if payload is self._pending_presence:
+                    self._pending_presence = None
+                if not await self._write(payload):
+                    # Socket went away; keep the command for the next session.
+                    self._send_queue.appendleft(payload)
+                    if payload.get("op") == 3 and self._pending_presence is None:
+                        self._pending_presence = payload
+                    return
+        except asyncio.CancelledError:
+            return
+
+    async def _write(self, data: dict[str, Any]) -> bool:
+        if not self.ws or self.ws.closed:
+            return False
+        if self.encoding == "etf":
+            await self.ws.send_bytes(self.codec.dumps(data))
+        else:
+            await self.ws.send_str(self.codec.dumps(data))
+        self._send_stats["sent"] += 1
+        return True
+
     async def _send(self, data: dict[str, Any]):
-        if self.ws and not self.ws.closed:
-            await self.ws.send_str(json.dumps(data))
+        if data.get("op") in self.PRIORITY_OPS:
+            await self._send_limiter.acquire()
+            await self._write(data)
+            return
+
+        if data.get("op") == 3 and self._pending_presence is not None:
+            # Only the latest presence matters, so update the queued one.
+            self._pending_presence["d"] = data["d"]
+            self._send_stats["coalesced"] += 1
+            return
+        if data.get("op") == 3:
+            self._pending_presence = data
+        self._send_queue.append(data)
+        self._send_stats["queued"] += 1
+        self._send_ready.set()
+
+    def request_members(
+        self,
+        guild_id: Union[int, Iterable[int]],
+        query: Optional[str] = "",
+        limit: int = 0,
+        presences: bool = False,
+        user_ids: Optional[list[int]] = None,
+        timeout: float = 30.0,
+    ) -> MemberChunkIterator:
+        if presences and not self.intents.has(Intents.GUILD_PRESENCES):
+            raise ValueError("presences=True requires the GUILD_PRESENCES intent.")
+        if not user_ids and not query and not self.intents.has(Intents.GUILD_MEMBERS):
+            raise ValueError("Requesting all members requires the GUILD_MEMBERS intent.")
+
+        guild_ids = [guild_id] if isinstance(guild_id, (int, str)) else list(guild_id)
+        payloads = [
+            member_request_payload(
+                gid,
+                uuid.uuid4().hex,
+                query=query,
+                limit=limit,
+                presences=presences,
+                user_ids=user_ids,
+            )
+            for gid in guild_ids
+        ]
+        return MemberChunkIterator(self, payloads, timeout=timeout)
+
+    async def update_presence(
+        self,
+        status: str = "online",
+        activities: Optional[list[dict[str, Any]]] = None,
+        afk: bool = False,
+        since: Optional[int] = None,
+    ):
+        await self._send(
+            {
+                "op": 3,
+                "d": {
+                    "since": since,
+                    "activities": activities or [],
+                    "status": status,
+                    "afk": afk,
+                },
+            }
+        )
+
+    @staticmethod
+    def _dispatch_key(data: Any) -> Any:
+        if not isinstance(data, dict):
+            return None
+        return data.get("channel_id") or data.get("guild_id")
 
     async def _dispatch_event(self, event_type: str, data: dict[str, Any]):
         event_name = event_type.lower()
-        if event_name == "ready":
-            from .models import User
-
-            self.client.user = User(data["user"])
-        elif event_name == "message_create":
+        if event_name == "message_create":
             await self.client._handle_message(data)
         elif event_name == "interaction_create":
             await self.client._handle_interaction(data)
@@ -142,8 +553,8 @@ class Gateway:
 
     async def close(self):
         self.closed = True
-        if self._heartbeat_task:
-            self._heartbeat_task.cancel()
+        self._stop_heartbeat()
+        self._stop_sender()
         if self.ws and not self.ws.closed:
             await self.ws.close()
         if self.session and not self.session.closed:
@@ -1,105 +1,550 @@
 import aiohttp
 import asyncio
+import copy
 import random
-from typing import Optional, Any
+import os
+import time
+from enum import IntEnum
+from urllib.parse import urlencode
+from typing import Optional, Any, AsyncIterator, Iterable, Mapping, Tuple, Union
 
-from .errors import HTTPException, Forbidden, NotFound, RateLimited
+from .broadcast import Broadcast
+from .cache import TTLCache
+from .circuit import CircuitBreaker, RetryBudget
+from .codec import JSONCodec, get_codec
+from .download import AttachmentDownloader
+from .errors import CircuitOpen, HTTPException, Forbidden, NotFound, RateLimited
+from .file import File
+from .iterators import (
+    AuditLogIterator,
+    BanIterator,
+    HistoryIterator,
+    MemberIterator,
+    ReactionIterator,
+    Snowflake,
+)
+from .ratelimit import PriorityLimiter, RateLimitBucket, TokenBucket
+
+
+MAJOR_PARAMETERS = ("channels", "guilds", "webhooks", "interactions")
+PRIORITY_HEADER = "X-Fiesta-Priority"
+
+
+class Priority(IntEnum):
+    """Request lanes, served lowest value first"""
+
+    HIGH = 0  # interaction callbacks and follow-ups
+    NORMAL = 1
+    LOW = 2  # bulk/background traffic
+
+
+def route_key(method: str, endpoint: str) -> Tuple[str, str]:
+    """Split an endpoint into its rate limit route template and major parameter"""
+    parts = endpoint.split("?", 1)[0].strip("/").split("/")
+    template: list[str] = []
+    major = ""
+    for index, part in enumerate(parts):
+        prev = parts[index - 1] if index else ""
+        before = parts[index - 2] if index > 1 else ""
+        if not major and prev in MAJOR_PARAMETERS and part.isdigit():
+            major = part
+            template.append(f"{{{prev[:-1]}_id}}")
+        elif before in ("webhooks", "interactions") and prev.isdigit():
+            # Webhook and interaction tokens are part of the major parameter.
+            if major == prev:
+                major = f"{prev}/{part}"
+            template.append("{token}")
+        elif part.isdigit():
+            template.append("{id}")
+        elif prev == "reactions":
+            template.append("{emoji}")
+        else:
+            template.append(part)
+    return f"{method} /{'/'.join(template)}", major
+
+
+def create_connector(
+    limit: int = 100,
+    limit_per_host: int = 0,
+    keepalive_timeout: float = 30.0,
+    dns_cache_ttl: Optional[int] = 300,
+) -> aiohttp.TCPConnector:
+    """Build a tuned connection pool (aiohttp already sets TCP_NODELAY)"""
+    return aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        keepalive_timeout=keepalive_timeout,
+        use_dns_cache=dns_cache_ttl is not None,
+        ttl_dns_cache=dns_cache_ttl,
+    )
+
+
+class PoolMonitor:
+    """Connection pool usage counters fed by an aiohttp TraceConfig"""
+
+    def __init__(self) -> None:
+        self.created = 0
+        self.reused = 0
+        self.queued = 0
+        self.queued_total = 0
+        self.queue_wait = 0.0
+        self.max_queue_wait = 0.0
+        self.in_flight = 0
+        self.trace_config = aiohttp.TraceConfig()
+        self.trace_config.on_request_start.append(self._on_request_start)
+        self.trace_config.on_request_end.append(self._on_request_done)
+        self.trace_config.on_request_exception.append(self._on_request_done)
+        self.trace_config.on_connection_create_end.append(self._on_create)
+        self.trace_config.on_connection_reuseconn.append(self._on_reuse)
+        self.trace_config.on_connection_queued_start.append(self._on_queued_start)
+        self.trace_config.on_connection_queued_end.append(self._on_queued_end)
+
+    async def _on_request_start(self, session: Any, ctx: Any, params: Any) -> None:
+        self.in_flight += 1
+
+    async def _on_request_done(self, session: Any, ctx: Any, params: Any) -> None:
+        self.in_flight -= 1
+
+    async def _on_create(self, session: Any, ctx: Any, params: Any) -> None:
+        self.created += 1
+
+    async def _on_reuse(self, session: Any, ctx: Any, params: Any) -> None:
+        self.reused += 1
+
+    async def _on_queued_start(self, session: Any, ctx: Any, params: Any) -> None:
+        self.queued += 1
+        self.queued_total += 1
+        ctx.queued_at = time.monotonic()
+
+    async def _on_queued_end(self, session: Any, ctx: Any, params: Any) -> None:
+        self.queued -= 1
+        waited = time.monotonic() - ctx.queued_at
+        self.queue_wait += waited
+        if waited > self.max_queue_wait:
+            self.max_queue_wait = waited
+
+    def stats(self, held: int = 0) -> dict[str, Any]:
+        # ``held`` counts connections kept past their request, e.g. open
+        # websockets. aiohttp does not report closes, so ``idle`` is an
+        # upper bound: connections opened that are not in use right now.
+        in_use = self.in_flight - self.queued + held
+        return {
+            "in_use": in_use,
+            "idle": max(0, self.created - in_use),
+            "queued": self.queued,
+            "created": self.created,
+            "reused": self.reused,
+            "avg_queue_wait": self.queue_wait / self.queued_total if self.queued_total else 0.0,
+            "max_queue_wait": self.max_queue_wait,
+        }
 
 
 class HTTPClient:
     BASE_URL = "https://discord.com/api/v10"
+    BUCKET_TTL = 300.0
+    SWEEP_INTERVAL = 60.0
 
-    def __init__(self, token: str):
+    def __init__(
+        self,
+        token: str,
+        codec: Optional[JSONCodec] = None,
+        global_rate: int = 50,
+        max_ratelimit_retries: int = 3,
+        cache: Optional[TTLCache] = None,
+        connector: Optional[aiohttp.BaseConnector] = None,
+        download_concurrency: int = 8,
+        base_url: Optional[str] = None,
+        unix_socket: Optional[str] = None,
+        local_ratelimit: Optional[bool] = None,
+        circuit_threshold: int = 5,
+        circuit_timeout: float = 10.0,
+        retry_ratio: float = 0.2,
+        pool_monitor: Optional[PoolMonitor] = None,
+    ):
         self.token = token
+        # Pointing base_url (or unix_socket) at a fiesta-proxy hands rate
+        # limiting to the proxy, which shares it between processes.
+        if unix_socket is not None:
+            base_url = base_url or "http://localhost/api/v10"
+            connector = aiohttp.UnixConnector(unix_socket)
+        if base_url is not None:
+            self.BASE_URL = base_url.rstrip("/")
+        self.local_ratelimit = base_url is None if local_ratelimit is None else local_ratelimit
+        self.unix_socket = unix_socket
+        self.connector = connector
+        self.pool_monitor = pool_monitor or PoolMonitor()
+        self.download_concurrency = download_concurrency
+        self._downloader: Optional[AttachmentDownloader] = None
+        self.codec = codec or get_codec()
         self.session: Optional[aiohttp.ClientSession] = None
-        self._global_lock = asyncio.Lock()
-        self._locks: dict[str, asyncio.Lock] = {}
+        self.max_ratelimit_retries = max_ratelimit_retries
+        # Every request takes a global token before it is sent, and all of
+        # them wait on the same barrier while a global 429 is in effect.
+        self._global_bucket = TokenBucket(global_rate, 1.0)
+        self._lanes = PriorityLimiter(self._global_bucket, lanes=len(Priority))
+        self._global_open = asyncio.Event()
+        self._global_open.set()
+        self._global_reset_at = 0.0
+        # Identical GETs share one in-flight request. Single-entity lookups
+        # (get_user/get_guild/get_channel) can also be kept in a TTL cache
+        # that gateway events invalidate.
+        self.cache = cache
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
+        self.cache_stats: dict[str, int] = {"hits": 0, "misses": 0, "coalesced": 0}
+        # 5xx storms trip a per-route and a global breaker, and retries are
+        # only spent while there is enough successful traffic to pay for them.
+        self.circuit_threshold = circuit_threshold
+        self.circuit_timeout = circuit_timeout
+        self._circuits: dict[str, CircuitBreaker] = {}
+        self._global_circuit = CircuitBreaker(circuit_threshold * 4, circuit_timeout)
+        self.retry_budget = RetryBudget(retry_ratio)
+        self._bucket_hashes: dict[str, str] = {}
+        self._buckets: dict[str, RateLimitBucket] = {}
+        self._last_sweep = time.monotonic()
 
     async def start(self):
         if self.session and not self.session.closed:
             return
         self.session = aiohttp.ClientSession(
-            headers={"Authorization": f"Bot {self.token}"}
+            headers={"Authorization": f"Bot {self.token}"} if self.token else None,
+            connector=self.connector,
+            connector_owner=self.connector is None or self.unix_socket is not None,
+            trace_configs=[self.pool_monitor.trace_config],
         )
 
+    @property
+    def pool_stats(self) -> dict[str, Any]:
+        return self.pool_monitor.stats()
+
     async def request(
         self,
         method: str,
         endpoint: str,
         json: Optional[dict[str, Any]] = None,
         files: Optional[dict[str, Any]] = None,
+        priority: Priority = Priority.NORMAL,
+        body: Optional[bytes] = None,
+        params: Optional[dict[str, Any]] = None,
+        use_cache: bool = False,
     ) -> Any:
         if not self.session:
             raise RuntimeError("HTTPClient not started. Call start() first.")
 
+        if params:
+            query = {k: v for k, v in params.items() if v is not None}
+            if query:
+                endpoint = f"{endpoint}?{urlencode(query)}"
         url = f"{self.BASE_URL}/{endpoint.lstrip('/')}"
-        bucket = f"{method}:{endpoint}"
+        route, major = route_key(method, endpoint)
+        self._sweep_buckets()
+        key = endpoint.strip("/")
+
+        if method != "GET":
+            try:
+                result = await self._request(
+                    method,
+                    url,
+                    route,
+                    major,
+                    json=json,
+                    files=files,
+                    priority=priority,
+                    body=body,
+                )
+            finally:
+                for value in (files or {}).values():
+                    if isinstance(value, File):
+                        value.close()
+            if self.cache is not None:
+                self.cache.pop(key)
+            return result
+
+        # Callers get their own copy of shared results, since they are free
+        # to mutate what they are handed.
+        if use_cache and self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.cache_stats["hits"] += 1
+                return copy.deepcopy(cached)
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.cache_stats["coalesced"] += 1
+            return copy.deepcopy(await asyncio.shield(task))
+
+        self.cache_stats["misses"] += 1
+        task = asyncio.ensure_future(self._request(method, url, route, major, priority=priority))
+        self._inflight[key] = task
+        task.add_done_callback(lambda t: self._finish_inflight(key, t, use_cache))
+        # Shielded so one caller giving up does not cancel it for the others.
+        return await asyncio.shield(task)
+
+    def _finish_inflight(self, key: str, task: "asyncio.Task[Any]", use_cache: bool) -> None:
+        # A request that was invalidated while in flight must not be cached.
+        current = self._inflight.get(key) is task
+        if current:
+            del self._inflight[key]
+        if task.cancelled():
+            return
+        if task.exception() is None and current and use_cache and self.cache is not None:
+            self.cache.set(key, copy.deepcopy(task.result()))
+
+    def invalidate(self, endpoint: str) -> None:
+        key = endpoint.strip("/")
+        self._inflight.pop(key, None)
+        if self.cache is not None:
+            self.cache.pop(key)
+
+    @property
+    def lane_stats(self) -> dict[str, dict[str, float]]:
+        stats: dict[str, dict[str, float]] = {}
+        for lane in Priority:
+            raw = self._lanes.stats[lane]
+            requests = raw["requests"]
+            stats[lane.name.lower()] = {
+                "requests": requests,
+                "queued": self._lanes.queued(lane),
+                "avg_wait": raw["total_wait"] / requests if requests else 0.0,
+                "max_wait": raw["max_wait"],
+            }
+        return stats
+
+    @property
+    def circuit_stats(self) -> dict[str, Any]:
+        return {
+            "global": self._global_circuit.state,
+            "open_routes": {
+                route: circuit.state
+                for route, circuit in self._circuits.items()
+                if circuit.state != CircuitBreaker.CLOSED
+            },
+            "retry_budget": self.retry_budget.stats,
+        }
+
+    def _get_circuit(self, route: str) -> CircuitBreaker:
+        circuit = self._circuits.get(route)
+        if circuit is None:
+            circuit = self._circuits[route] = CircuitBreaker(
+                self.circuit_threshold, self.circuit_timeout
+            )
+        return circuit
+
+    def _check_circuits(self, route: str, circuit: CircuitBreaker) -> None:
+        if not self._global_circuit.allow():
+            raise CircuitOpen("global", self._global_circuit.retry_after)
+        if not circuit.allow():
+            raise CircuitOpen(route, circuit.retry_after)
+
+    def _record_outcome(self, circuit: CircuitBreaker, ok: bool) -> None:
+        if ok:
+            circuit.record_success()
+            self._global_circuit.record_success()
+            self.retry_budget.record_success()
+        else:
+            circuit.record_failure()
+            self._global_circuit.record_failure()
+
+    def _bucket_key(self, route: str, major: str) -> str:
+        return f"{self._bucket_hashes.get(route, route)}:{major}"
 
-        if bucket not in self._locks:
-            self._locks[bucket] = asyncio.Lock()
+    def _get_bucket(self, route: str, major: str) -> RateLimitBucket:
+        key = self._bucket_key(route, major)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = RateLimitBucket()
+        return bucket
 
-        async with self._locks[bucket]:
-            return await self._request(method, url, json=json, files=files)
+    def _learn_bucket(
+        self, route: str, major: str, bucket: RateLimitBucket, headers: Mapping[str, str]
+    ) -> None:
+        bucket_hash = headers.get("X-RateLimit-Bucket")
+        if not bucket_hash or self._bucket_hashes.get(route) == bucket_hash:
+            return
+        old_key = self._bucket_key(route, major)
+        self._bucket_hashes[route] = bucket_hash
+        new_key = self._bucket_key(route, major)
+        # Routes sharing a hash share one bucket; keep whichever exists.
+        self._buckets.setdefault(new_key, bucket)
+        if self._buckets.get(old_key) is bucket and old_key != new_key:
+            del self._buckets[old_key]
+
+    def _sweep_buckets(self) -> None:
+        now = time.monotonic()
+        if now - self._last_sweep < self.SWEEP_INTERVAL:
+            return
+        self._last_sweep = now
+        for key, bucket in list(self._buckets.items()):
+            if bucket.idle and now - bucket.last_used > self.BUCKET_TTL:
+                del self._buckets[key]
 
     async def _request(
         self,
         method: str,
         url: str,
+        route: str,
+        major: str,
         json: Optional[dict[str, Any]] = None,
         files: Optional[dict[str, Any]] = None,
         retries: int = 5,
+        priority: Priority = Priority.NORMAL,
+        body: Optional[bytes] = None,
     ) -> Any:
-        if not self.session:
-            raise RuntimeError("HTTPClient not started. Call start() first.")
-
-        kwargs: dict[str, Any] = {}
-        if json:
-            kwargs["json"] = json
-        if files:
-            data = aiohttp.FormData()
-            for key, value in files.items():
-                data.add_field(key, value)
-            kwargs["data"] = data
-
-        async with self.session.request(method, url, **kwargs) as resp:
-            text = await resp.text()
-            data: Any
+        circuit = self._get_circuit(route)
+        ratelimit_retries = 0
+        while True:
+            self._check_circuits(route, circuit)
             try:
-                data = await resp.json()
-            except Exception:
-                data = {"text": text}
+                status, headers, raw = await self._perform(
+                    method, url, route, major, priority, **self._build_body(json, files, body)
+                )
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                self._record_outcome(circuit, False)
+                raise
+            self._record_outcome(circuit, status < 500)
+
+            data: Any = None
+            if raw:
+                try:
+                    data = self.codec.loads(raw)
+                except ValueError:
+                    data = {"text": raw.decode("utf-8", "replace")}
 
-            if 200 <= resp.status < 300:
+            if 200 <= status < 300:
                 return data
 
-            if resp.status == 429:  # Rate limited
-                retry_after = float(resp.headers.get("retry-after", "1"))
-                is_global = resp.headers.get("x-ratelimit-global")
-                if is_global:
-                    async with self._global_lock:
-                        await asyncio.sleep(retry_after)
-                else:
-                    await asyncio.sleep(retry_after)
-                return await self._request(
-                    method, url, json=json, files=files, retries=retries
-                )
+            if not isinstance(data, dict):
+                data = {}
+
+            if status == 429:  # Rate limited
+                retry_after = float(data.get("retry_after") or headers.get("retry-after", "1"))
+                if data.get("global"):
+                    self._pause_global(retry_after)
+                if ratelimit_retries >= self.max_ratelimit_retries:
+                    raise RateLimited(retry_after, data.get("message", "Rate limited"))
+                ratelimit_retries += 1
+                await asyncio.sleep(retry_after)
+                continue
 
-            if resp.status == 403:
+            if status == 403:
                 raise Forbidden(data.get("message", "Forbidden"))
-            if resp.status == 404:
+            if status == 404:
                 raise NotFound(data.get("message", "Not found"))
 
-            if retries > 0 and resp.status >= 500:
+            if (
+                retries > 0
+                and status >= 500
+                and circuit.state == CircuitBreaker.CLOSED
+                and self._global_circuit.state == CircuitBreaker.CLOSED
+                and self.retry_budget.try_acquire()
+            ):
                 delay = 2 ** (5 - retries) + random.random()
+                retries -= 1
                 await asyncio.sleep(delay)
-                return await self._request(
-                    method, url, json=json, files=files, retries=retries - 1
+                continue
+
+            raise HTTPException(status, data.get("message", "HTTP error"))
+
+    async def _perform(
+        self,
+        method: str,
+        url: str,
+        route: str,
+        major: str,
+        priority: Priority = Priority.NORMAL,
+        **kwargs: Any,
+    ) -> Tuple[int, Mapping[str, str], bytes]:
+        """Send one request through the route bucket and the global limiter"""
+        if not self.session:
+            raise RuntimeError("HTTPClient not started. Call start() first.")
+
+        if not self.local_ratelimit:
+            # A rate limit proxy does the pacing; it only needs the lane.
+            kwargs["headers"] = {**kwargs.get("headers", {}), PRIORITY_HEADER: str(int(priority))}
+            async with self.session.request(method, url, **kwargs) as resp:
+                return resp.status, resp.headers, await resp.read()
+
+        # Interaction endpoints are not bound by the global rate limit.
+        exempt = route.startswith("POST /interactions/")
+        bucket = self._get_bucket(route, major)
+        await bucket.acquire()
+        headers: Optional[Mapping[str, str]] = None
+        status = 0
+        try:
+            while True:
+                if not exempt:
+                    await self._global_open.wait()
+                await self._lanes.acquire(priority, exempt=exempt)
+                # A global 429 may have closed the barrier while this request
+                # sat in its lane; the token is spent, but it must not fire.
+                if exempt or self._global_open.is_set():
+                    break
+            async with self.session.request(method, url, **kwargs) as resp:
+                headers = resp.headers
+                status = resp.status
+                raw = await resp.read()
+        finally:
+            bucket.release(headers, status)
+        self._learn_bucket(route, major, bucket, headers)
+        if status == 429 and (
+            headers.get("X-RateLimit-Global") or headers.get("X-RateLimit-Scope") == "global"
+        ):
+            self._pause_global(float(headers.get("Retry-After", "1")))
+        return status, headers, raw
+
+    def _build_body(
+        self,
+        json: Optional[dict[str, Any]],
+        files: Optional[dict[str, Any]],
+        body: Optional[bytes] = None,
+    ) -> dict[str, Any]:
+        # Form data cannot be sent twice, so every attempt builds its own body.
+        kwargs: dict[str, Any] = {}
+        if body is not None:
+            # Already encoded JSON, e.g. one payload shared by a broadcast.
+            kwargs["data"] = body
+            kwargs["headers"] = {"Content-Type": "application/json"}
+        elif files:
+            form = aiohttp.FormData()
+            if json:
+                form.add_field(
+                    "payload_json",
+                    self.codec.dumps(json),
+                    content_type="application/json",
                 )
+            for key, value in files.items():
+                if isinstance(value, File):
+                    # Streamed from its source; rewound if a retry follows a read.
+                    value.reset()
+                    form.add_field(
+                        key,
+                        value.to_payload(),
+                        filename=value.filename,
+                        content_type=value.content_type,
+                    )
+                else:
+                    form.add_field(key, value)
+            kwargs["data"] = form
+        elif json:
+            kwargs["data"] = self.codec.dumps_bytes(json)
+            kwargs["headers"] = {"Content-Type": "application/json"}
+        return kwargs
 
-            raise HTTPException(resp.status, data.get("message", "HTTP error"))
+    def _pause_global(self, retry_after: float) -> None:
+        loop = asyncio.get_running_loop()
+        reset_at = loop.time() + retry_after
+        if reset_at <= self._global_reset_at:
+            return
+        self._global_reset_at = reset_at
+        self._global_open.clear()
+        loop.call_at(reset_at, self._resume_global, reset_at)
+
+    def _resume_global(self, reset_at: float) -> None:
+        # A later global 429 may have pushed the deadline out further.
+        if reset_at >= self._global_reset_at:
+            self._global_open.set()
 
     async def get_channel(self, channel_id: int) -> dict[str, Any]:
-        return await self.request("GET", f"/channels/{channel_id}")
+        return await self.request("GET", f"/channels/{channel_id}", use_cache=True)
 
     async def send_message(
         self,
@@ -107,6 +552,7 @@ class HTTPClient:
         content: Optional[str] = None,
         embeds: Optional[list[dict[str, Any]]] = None,
         components: Optional[list[dict[str, Any]]] = None,
+        files: Optional[list[File]] = None,
     ) -> dict[str, Any]:
         json_data: dict[str, Any] = {}
         if content:
@@ -115,8 +561,34 @@ class HTTPClient:
             json_data["embeds"] = embeds
         if components:
             json_data["components"] = components
+        form_files: Optional[dict[str, Any]] = None
+        if files:
+            json_data["attachments"] = [file.to_attachment(i) for i, file in enumerate(files)]
+            form_files = {f"files[{i}]": file for i, file in enumerate(files)}
 
-        return await self.request("POST", f"/channels/{channel_id}/messages", json=json_data)
+        return await self.request(
+            "POST", f"/channels/{channel_id}/messages", json=json_data, files=form_files
+        )
+
+    async def edit_message(
+        self,
+        channel_id: int,
+        message_id: int,
+        content: Optional[str] = None,
+        embeds: Optional[list[dict[str, Any]]] = None,
+        components: Optional[list[dict[str, Any]]] = None,
+    ) -> dict[str, Any]:
+        json_data: dict[str, Any] = {}
+        if content is not None:
+            json_data["content"] = content
+        if embeds is not None:
+            json_data["embeds"] = embeds
+        if components is not None:
+            json_data["components"] = components
+
+        return await self.request(
+            "PATCH", f"/channels/{channel_id}/messages/{message_id}", json=json_data
+        )
 
     async def create_interaction_response(
         self,
@@ -130,16 +602,164 @@ class HTTPClient:
             json_data["data"] = data
 
         return await self.request(
-            "POST", f"/interactions/{interaction_id}/{token}/callback", json=json_data
+            "POST",
+            f"/interactions/{interaction_id}/{token}/callback",
+            json=json_data,
+            priority=Priority.HIGH,
+        )
+
+    async def create_followup_message(
+        self,
+        application_id: int,
+        token: str,
+        content: Optional[str] = None,
+        embeds: Optional[list[dict[str, Any]]] = None,
+        components: Optional[list[dict[str, Any]]] = None,
+        ephemeral: bool = False,
+    ) -> dict[str, Any]:
+        json_data: dict[str, Any] = {}
+        if content:
+            json_data["content"] = content
+        if embeds:
+            json_data["embeds"] = embeds
+        if components:
+            json_data["components"] = components
+        if ephemeral:
+            json_data["flags"] = 1 << 6
+
+        return await self.request(
+            "POST", f"/webhooks/{application_id}/{token}", json=json_data, priority=Priority.HIGH
+        )
+
+    async def edit_original_interaction_response(
+        self,
+        application_id: int,
+        token: str,
+        content: Optional[str] = None,
+        embeds: Optional[list[dict[str, Any]]] = None,
+        components: Optional[list[dict[str, Any]]] = None,
+    ) -> dict[str, Any]:
+        json_data: dict[str, Any] = {}
+        if content is not None:
+            json_data["content"] = content
+        if embeds is not None:
+            json_data["embeds"] = embeds
+        if components is not None:
+            json_data["components"] = components
+
+        return await self.request(
+            "PATCH",
+            f"/webhooks/{application_id}/{token}/messages/@original",
+            json=json_data,
+            priority=Priority.HIGH,
+        )
+
+    async def create_dm(self, recipient_id: int) -> dict[str, Any]:
+        return await self.request(
+            "POST", "/users/@me/channels", json={"recipient_id": str(recipient_id)}
         )
 
     async def get_guild(self, guild_id: int) -> dict[str, Any]:
-        return await self.request("GET", f"/guilds/{guild_id}")
+        return await self.request("GET", f"/guilds/{guild_id}", use_cache=True)
 
     async def get_user(self, user_id: int) -> dict[str, Any]:
-        return await self.request("GET", f"/users/{user_id}")
+        return await self.request("GET", f"/users/{user_id}", use_cache=True)
+
+    def history(
+        self,
+        channel_id: int,
+        limit: Optional[int] = 100,
+        before: Optional[Snowflake] = None,
+        after: Optional[Snowflake] = None,
+    ) -> HistoryIterator:
+        return HistoryIterator(self, channel_id, limit=limit, before=before, after=after)
+
+    def members(
+        self, guild_id: int, limit: Optional[int] = 1000, after: Optional[Snowflake] = None
+    ) -> MemberIterator:
+        return MemberIterator(self, guild_id, limit=limit, after=after)
+
+    def bans(
+        self,
+        guild_id: int,
+        limit: Optional[int] = 1000,
+        before: Optional[Snowflake] = None,
+        after: Optional[Snowflake] = None,
+    ) -> BanIterator:
+        return BanIterator(self, guild_id, limit=limit, before=before, after=after)
+
+    def reactions(
+        self,
+        channel_id: int,
+        message_id: int,
+        emoji: str,
+        limit: Optional[int] = 100,
+        after: Optional[Snowflake] = None,
+    ) -> ReactionIterator:
+        return ReactionIterator(self, channel_id, message_id, emoji, limit=limit, after=after)
+
+    def audit_logs(
+        self,
+        guild_id: int,
+        limit: Optional[int] = 100,
+        before: Optional[Snowflake] = None,
+        user_id: Optional[int] = None,
+        action_type: Optional[int] = None,
+    ) -> AuditLogIterator:
+        return AuditLogIterator(
+            self, guild_id, user_id=user_id, action_type=action_type, limit=limit, before=before
+        )
+
+    async def get_gateway_bot(self) -> dict[str, Any]:
+        return await self.request("GET", "/gateway/bot")
+
+    def broadcast(
+        self,
+        targets: Iterable[int],
+        content: Optional[str] = None,
+        embeds: Optional[list[dict[str, Any]]] = None,
+        components: Optional[list[dict[str, Any]]] = None,
+        *,
+        dm: bool = False,
+        checkpoint: Optional[Union[str, "os.PathLike[str]"]] = None,
+        concurrency: int = 50,
+    ) -> Broadcast:
+        payload: dict[str, Any] = {}
+        if content:
+            payload["content"] = content
+        if embeds:
+            payload["embeds"] = embeds
+        if components:
+            payload["components"] = components
+        return Broadcast(
+            self, payload, targets, dm=dm, checkpoint=checkpoint, concurrency=concurrency
+        )
+
+    @property
+    def downloader(self) -> AttachmentDownloader:
+        if not self.session:
+            raise RuntimeError("HTTPClient not started. Call start() first.")
+        if self._downloader is None:
+            # CDN downloads never go through the proxy socket.
+            connector = None if self.unix_socket else self.session.connector
+            self._downloader = AttachmentDownloader(
+                connector,
+                max_concurrency=self.download_concurrency,
+                trace_configs=[self.pool_monitor.trace_config] if connector else None,
+            )
+        return self._downloader
+
+    def iter_attachment(self, url: str, offset: int = 0) -> AsyncIterator[bytes]:
+        return self.downloader.iter_chunks(url, offset)
+
+    async def save_attachment(
+        self, url: str, path: Union[str, "os.PathLike[str]"], resume: bool = True
+    ) -> int:
+        return await self.downloader.save(url, path, resume=resume)
 
     async def close(self):
+        if self._downloader:
+            await self._downloader.close()
         if self.session and not self.session.closed:
             await self.session.close()
           
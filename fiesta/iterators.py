@@ -0,0 +1,260 @@
+from __future__ import annotations
+import asyncio
+from collections import deque
+from datetime import datetime
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Deque,
+    Dict,
+    Generic,
+    List,
+    NamedTuple,
+    Optional,
+    TypeVar,
+    Union,
+)
+from urllib.parse import quote
+
+from .models import Member, Message, User
+from .utils import time_snowflake
+
+if TYPE_CHECKING:
+    from .http import HTTPClient
+
+
+T = TypeVar("T")
+Snowflake = Union[int, str, datetime]
+
+
+def _snowflake(value: Optional[Snowflake]) -> Optional[int]:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return time_snowflake(value)
+    return int(value)
+
+
+class Ban(NamedTuple):
+    user: User
+    reason: Optional[str]
+
+
+class AuditLogEntry(NamedTuple):
+    id: int
+    action_type: int
+    user_id: Optional[int]
+    target_id: Optional[str]
+    reason: Optional[str]
+    changes: List[Dict[str, Any]]
+    options: Dict[str, Any]
+
+
+class PageIterator(Generic[T]):
+    """Async iterator over a snowflake-paginated endpoint.
+
+    While the current page is being consumed the next one is already being
+    fetched, so a long scan overlaps request latency with processing. Pages
+    are walked with a ``before`` cursor (newest first) unless ``after`` is
+    given, in which case items come oldest first.
+    """
+
+    PAGE_SIZE = 100
+    ASCENDING = False  # Endpoints that only support ``after`` set this
+
+    def __init__(
+        self,
+        http: "HTTPClient",
+        limit: Optional[int] = None,
+        before: Optional[Snowflake] = None,
+        after: Optional[Snowflake] = None,
+    ):
+        self.http = http
+        self.limit = limit
+        self.reverse = after is not None or self.ASCENDING
+        self.before = _snowflake(before)
+        self.after = _snowflake(after)
+        if self.reverse and self.after is None:
+            self.after = 0
+        self._to_fetch = limit
+        self._buffer: Deque[Dict[str, Any]] = deque()
+        self._next_page: Optional[asyncio.Task[List[Dict[str, Any]]]] = None
+        self._exhausted = limit is not None and limit <= 0
+
+    def _endpoint(self) -> str:
+        raise NotImplementedError
+
+    def _params(self) -> Dict[str, Any]:
+        return {}
+
+    def _extract(self, data: Any) -> List[Dict[str, Any]]:
+        return data
+
+    def _item_id(self, item: Dict[str, Any]) -> int:
+        return int(item["id"])
+
+    def _convert(self, item: Dict[str, Any]) -> T:
+        raise NotImplementedError
+
+    async def _fetch_page(self) -> List[Dict[str, Any]]:
+        size = self.PAGE_SIZE
+        if self._to_fetch is not None:
+            size = min(size, self._to_fetch)
+        params: Dict[str, Any] = {"limit": size, **self._params()}
+        if self.reverse:
+            params["after"] = self.after
+            if self.before is not None:
+                params["before"] = self.before
+        else:
+            params["before"] = self.before
+
+        page = self._extract(await self.http.request("GET", self._endpoint(), params=params))
+        if self.reverse:
+            page.sort(key=self._item_id)
+            if self.before is not None:
+                page = [item for item in page if self._item_id(item) < self.before]
+        if len(page) < size:
+            self._exhausted = True
+        if page:
+            if self.reverse:
+                self.after = self._item_id(page[-1])
+            else:
+                self.before = self._item_id(page[-1])
+        if self._to_fetch is not None:
+            page = page[: self._to_fetch]
+            self._to_fetch -= len(page)
+            if self._to_fetch <= 0:
+                self._exhausted = True
+        return page
+
+    def _prefetch(self) -> None:
+        if self._next_page is None and not self._exhausted:
+            self._next_page = asyncio.ensure_future(self._fetch_page())
+
+    def __aiter__(self) -> "PageIterator[T]":
+        return self
+
+    async def __anext__(self) -> T:
+        while not self._buffer:
+            self._prefetch()
+            if self._next_page is None:
+                raise StopAsyncIteration
+            task, self._next_page = self._next_page, None
+            self._buffer.extend(await task)
+            # Read ahead: fetch the next page while this one is consumed.
+            self._prefetch()
+        return self._convert(self._buffer.popleft())
+
+    async def flatten(self) -> List[T]:
+        return [item async for item in self]
+
+    def cancel(self) -> None:
+        if self._next_page is not None:
+            self._next_page.cancel()
+            self._next_page = None
+        self._exhausted = True
+
+
+class HistoryIterator(PageIterator[Message]):
+    def __init__(self, http: "HTTPClient", channel_id: int, **kwargs: Any):
+        super().__init__(http, **kwargs)
+        self.channel_id = channel_id
+
+    def _endpoint(self) -> str:
+        return f"/channels/{self.channel_id}/messages"
+
+    def _convert(self, item: Dict[str, Any]) -> Message:
+        return Message(item)
+
+
+class MemberIterator(PageIterator[Member]):
+    PAGE_SIZE = 1000
+    ASCENDING = True
+
+    def __init__(self, http: "HTTPClient", guild_id: int, **kwargs: Any):
+        super().__init__(http, **kwargs)
+        self.guild_id = guild_id
+
+    def _endpoint(self) -> str:
+        return f"/guilds/{self.guild_id}/members"
+
+    def _item_id(self, item: Dict[str, Any]) -> int:
+        return int(item["user"]["id"])
+
+    def _convert(self, item: Dict[str, Any]) -> Member:
+        return Member(item, guild_id=self.guild_id)
+
+
+class BanIterator(PageIterator[Ban]):
+    PAGE_SIZE = 1000
+    ASCENDING = True
+
+    def __init__(self, http: "HTTPClient", guild_id: int, **kwargs: Any):
+        super().__init__(http, **kwargs)
+        self.guild_id = guild_id
+
+    def _endpoint(self) -> str:
+        return f"/guilds/{self.guild_id}/bans"
+
+    def _item_id(self, item: Dict[str, Any]) -> int:
+        return int(item["user"]["id"])
+
+    def _convert(self, item: Dict[str, Any]) -> Ban:
+        return Ban(User(item["user"]), item.get("reason"))
+
+
+class ReactionIterator(PageIterator[User]):
+    ASCENDING = True
+
+    def __init__(
+        self, http: "HTTPClient", channel_id: int, message_id: int, emoji: str, **kwargs: Any
+    ):
+        super().__init__(http, **kwargs)
+        self.channel_id = channel_id
+        self.message_id = message_id
+        self.emoji = emoji
+
+    def _endpoint(self) -> str:
+        return (
+            f"/channels/{self.channel_id}/messages/{self.message_id}"
+            f"/reactions/{quote(self.emoji)}"
+        )
+
+    def _convert(self, item: Dict[str, Any]) -> User:
+        return User(item)
+
+
+class AuditLogIterator(PageIterator[AuditLogEntry]):
+    def __init__(
+        self,
+        http: "HTTPClient",
+        guild_id: int,
+        user_id: Optional[int] = None,
+        action_type: Optional[int] = None,
+        **kwargs: Any,
+    ):
+        super().__init__(http, **kwargs)
+        self.guild_id = guild_id
+        self.user_id = user_id
+        self.action_type = action_type
+
+    def _endpoint(self) -> str:
+        return f"/guilds/{self.guild_id}/audit-logs"
+
+    def _params(self) -> Dict[str, Any]:
+        return {"user_id": self.user_id, "action_type": self.action_type}
+
+    def _extract(self, data: Any) -> List[Dict[str, Any]]:
+        return data.get("audit_log_entries", [])
+
+    def _convert(self, item: Dict[str, Any]) -> AuditLogEntry:
+        user_id = item.get("user_id")
+        return AuditLogEntry(
+            id=int(item["id"]),
+            action_type=item.get("action_type", 0),
+            user_id=int(user_id) if user_id else None,
+            target_id=item.get("target_id"),
+            reason=item.get("reason"),
+            changes=item.get("changes", []),
+            options=item.get("options", {}),
+        )
@@ -3,5 +3,6 @@ from .guild import Guild
 from .channel import Channel
 from .message import Message
 from .role import Role
+from .member import Member
 
-__all__ = ["User", "Guild", "Channel", "Message", "Role"]
+__all__ = ["User", "Guild", "Channel", "Message", "Role", "Member"]
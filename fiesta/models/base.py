@@ -0,0 +1,66 @@
+from __future__ import annotations
+from datetime import datetime
+from typing import Any, Callable, ClassVar, Dict, List, NamedTuple, Optional, Tuple
+
+
+_MISSING = object()
+
+
+class Field(NamedTuple):
+    """One payload key of a model: its default, converter and attribute name"""
+
+    key: str
+    default: Any = None
+    convert: Optional[Callable[[Any], Any]] = None
+    attr: Optional[str] = None
+
+
+def optional_int(value: Any) -> Optional[int]:
+    return int(value) if value else None
+
+
+def optional_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value.replace("Z", "+00:00")) if value else None
+
+
+def snowflake_list(value: List[Any]) -> List[int]:
+    return [int(item) for item in value]
+
+
+class Model:
+    """Base for models parsed from a table of ``Field`` entries.
+
+    ``_update`` applies partial payloads (GUILD_UPDATE, CHANNEL_UPDATE, ...)
+    in place, touching only the keys present, so cached references to the
+    object stay valid.
+    """
+
+    __slots__ = ()
+
+    _FIELDS: ClassVar[Tuple[Field, ...]] = ()
+    _FIELD_MAP: ClassVar[Dict[str, Field]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._FIELD_MAP = {field.key: field for field in cls._FIELDS}
+
+    def _from_data(self, data: Dict[str, Any]) -> None:
+        for key, default, convert, attr in self._FIELDS:
+            value = data.get(key, _MISSING)
+            if value is _MISSING:
+                if default.__class__ in (list, dict):
+                    default = default.copy()
+                value = default
+            elif convert is not None:
+                value = convert(value)
+            setattr(self, attr or key, value)
+
+    def _update(self, data: Dict[str, Any]) -> None:
+        fields = self._FIELD_MAP
+        for key, value in data.items():
+            field = fields.get(key)
+            if field is None:
+                continue
+            if field.convert is not None:
+                value = field.convert(value)
+            setattr(self, field.attr or key, value)
@@ -2,9 +2,10 @@ from __future__ import annotations
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from ..utils import snowflake_time
+from .base import Field, Model, optional_datetime, optional_int
 
 
-class Channel:
+class Channel(Model):
     TYPES: Dict[int, str] = {
         0: "GUILD_TEXT",
         1: "DM",
@@ -21,53 +22,67 @@ class Channel:
         16: "GUILD_MEDIA",
     }
 
-    def __init__(self, data: dict):
-        self.id: int = int(data.get("id", 0))
-        self.type: int = data.get("type", 0)
-        self.guild_id: Optional[int] = (
-            int(data["guild_id"]) if data.get("guild_id") else None
-        )
-        self.position: Optional[int] = data.get("position")
-        self.name: str = data.get("name", "")
-        self.topic: Optional[str] = data.get("topic")
-        self.nsfw: bool = data.get("nsfw", False)
-        self.last_message_id: Optional[int] = (
-            int(data["last_message_id"]) if data.get("last_message_id") else None
-        )
-        self.bitrate: Optional[int] = data.get("bitrate")
-        self.user_limit: Optional[int] = data.get("user_limit")
-        self.rate_limit_per_user: int = data.get("rate_limit_per_user", 0)
-        self.default_thread_rate_limit_per_user: Optional[int] = data.get(
-            "default_thread_rate_limit_per_user"
-        )
-        self.icon: Optional[str] = data.get("icon")
-        self.owner_id: Optional[int] = (
-            int(data["owner_id"]) if data.get("owner_id") else None
-        )
-        self.application_id: Optional[int] = (
-            int(data["application_id"]) if data.get("application_id") else None
-        )
-        self.parent_id: Optional[int] = (
-            int(data["parent_id"]) if data.get("parent_id") else None
-        )
-        self.last_pin_timestamp: Optional[datetime] = (
-            datetime.fromisoformat(data["last_pin_timestamp"].replace("Z", "+00:00"))
-            if data.get("last_pin_timestamp")
-            else None
-        )
-        self.rtc_region: Optional[str] = data.get("rtc_region")
-        self.video_quality_mode: Optional[int] = data.get("video_quality_mode")
-        self.message_count: Optional[int] = data.get("message_count")
-        self.member_count: Optional[int] = data.get("member_count")
-        self.default_auto_archive_duration: Optional[int] = data.get(
-            "default_auto_archive_duration"
-        )
-        self.permissions: Optional[str] = data.get("permissions")
-        self.flags: int = data.get("flags", 0)
-
+    _FIELDS = (
+        Field("id", 0, int),
+        Field("type", 0),
+        Field("guild_id", None, optional_int),
+        Field("position"),
+        Field("name", ""),
+        Field("topic"),
+        Field("nsfw", False),
+        Field("last_message_id", None, optional_int),
+        Field("bitrate"),
+        Field("user_limit"),
+        Field("rate_limit_per_user", 0),
+        Field("default_thread_rate_limit_per_user"),
+        Field("icon"),
+        Field("owner_id", None, optional_int),
+        Field("application_id", None, optional_int),
+        Field("parent_id", None, optional_int),
+        Field("last_pin_timestamp", None, optional_datetime),
+        Field("rtc_region"),
+        Field("video_quality_mode"),
+        Field("message_count"),
+        Field("member_count"),
+        Field("default_auto_archive_duration"),
+        Field("permissions"),
+        Field("flags", 0),
         # Forum / media specific
-        self.available_tags: List[Dict[str, Any]] = data.get("available_tags", [])
-        self.applied_tags: List[int] = data.get("applied_tags", [])
+        Field("available_tags", []),
+        Field("applied_tags", []),
+    )
+
+    __slots__ = tuple(field.attr or field.key for field in _FIELDS)
+
+    id: int
+    type: int
+    guild_id: Optional[int]
+    position: Optional[int]
+    name: str
+    topic: Optional[str]
+    nsfw: bool
+    last_message_id: Optional[int]
+    bitrate: Optional[int]
+    user_limit: Optional[int]
+    rate_limit_per_user: int
+    default_thread_rate_limit_per_user: Optional[int]
+    icon: Optional[str]
+    owner_id: Optional[int]
+    application_id: Optional[int]
+    parent_id: Optional[int]
+    last_pin_timestamp: Optional[datetime]
+    rtc_region: Optional[str]
+    video_quality_mode: Optional[int]
+    message_count: Optional[int]
+    member_count: Optional[int]
+    default_auto_archive_duration: Optional[int]
+    permissions: Optional[str]
+    flags: int
+    available_tags: List[Dict[str, Any]]
+    applied_tags: List[int]
+
+    def __init__(self, data: dict):
+        self._from_data(data)
 
     @property
     def created_at(self) -> Optional[datetime]:
@@ -2,68 +2,86 @@ from __future__ import annotations
 from typing import Optional, List
 from datetime import datetime
 from ..utils import snowflake_time
+from .base import Field, Model, optional_int
 
 
-class Guild:
+class Guild(Model):
+    _FIELDS = (
+        Field("id", 0, int),
+        Field("name", ""),
+        Field("icon"),
+        Field("icon_hash"),
+        Field("splash"),
+        Field("discovery_splash"),
+        Field("owner_id", None, optional_int),
+        Field("permissions"),
+        Field("region"),  # deprecated
+        Field("rtc_region"),
+        Field("afk_channel_id", None, optional_int),
+        Field("afk_timeout"),
+        Field("widget_enabled", False),
+        Field("widget_channel_id", None, optional_int),
+        Field("verification_level", 0),
+        Field("default_message_notifications", 0),
+        Field("explicit_content_filter", 0),
+        Field("features", []),
+        Field("mfa_level", 0),
+        Field("system_channel_id", None, optional_int),
+        Field("system_channel_flags", 0),
+        Field("rules_channel_id", None, optional_int),
+        Field("max_presences"),
+        Field("max_members"),
+        Field("max_video_channel_users"),
+        Field("vanity_url_code"),
+        Field("description"),
+        Field("banner"),
+        Field("premium_tier", 0),
+        Field("premium_subscription_count", 0),
+        Field("preferred_locale", "en-US"),
+        Field("public_updates_channel_id", None, optional_int),
+        Field("safety_alerts_channel_id", None, optional_int),
+        Field("nsfw_level", 0),
+    )
+
+    __slots__ = tuple(field.attr or field.key for field in _FIELDS)
+
+    id: int
+    name: str
+    icon: Optional[str]
+    icon_hash: Optional[str]
+    splash: Optional[str]
+    discovery_splash: Optional[str]
+    owner_id: Optional[int]
+    permissions: Optional[str]
+    region: Optional[str]
+    rtc_region: Optional[str]
+    afk_channel_id: Optional[int]
+    afk_timeout: Optional[int]
+    widget_enabled: bool
+    widget_channel_id: Optional[int]
+    verification_level: int
+    default_message_notifications: int
+    explicit_content_filter: int
+    features: List[str]
+    mfa_level: int
+    system_channel_id: Optional[int]
+    system_channel_flags: int
+    rules_channel_id: Optional[int]
+    max_presences: Optional[int]
+    max_members: Optional[int]
+    max_video_channel_users: Optional[int]
+    vanity_url_code: Optional[str]
+    description: Optional[str]
+    banner: Optional[str]
+    premium_tier: int
+    premium_subscription_count: int
+    preferred_locale: str
+    public_updates_channel_id: Optional[int]
+    safety_alerts_channel_id: Optional[int]
+    nsfw_level: int
+
     def __init__(self, data: dict):
-        self.id: int = int(data.get("id", 0))
-        self.name: str = data.get("name", "")
-        self.icon: Optional[str] = data.get("icon")
-        self.icon_hash: Optional[str] = data.get("icon_hash")
-        self.splash: Optional[str] = data.get("splash")
-        self.discovery_splash: Optional[str] = data.get("discovery_splash")
-        self.owner_id: Optional[int] = (
-            int(data["owner_id"]) if data.get("owner_id") else None
-        )
-        self.permissions: Optional[str] = data.get("permissions")
-        self.region: Optional[str] = data.get("region")  # deprecated
-        self.rtc_region: Optional[str] = data.get("rtc_region")
-        self.afk_channel_id: Optional[int] = (
-            int(data["afk_channel_id"]) if data.get("afk_channel_id") else None
-        )
-        self.afk_timeout: Optional[int] = data.get("afk_timeout")
-        self.widget_enabled: bool = data.get("widget_enabled", False)
-        self.widget_channel_id: Optional[int] = (
-            int(data["widget_channel_id"]) if data.get("widget_channel_id") else None
-        )
-        self.verification_level: int = data.get("verification_level", 0)
-        self.default_message_notifications: int = data.get(
-            "default_message_notifications", 0
-        )
-        self.explicit_content_filter: int = data.get("explicit_content_filter", 0)
-        self.features: List[str] = data.get("features", [])
-        self.mfa_level: int = data.get("mfa_level", 0)
-        self.system_channel_id: Optional[int] = (
-            int(data["system_channel_id"]) if data.get("system_channel_id") else None
-        )
-        self.system_channel_flags: int = data.get("system_channel_flags", 0)
-        self.rules_channel_id: Optional[int] = (
-            int(data["rules_channel_id"]) if data.get("rules_channel_id") else None
-        )
-        self.max_presences: Optional[int] = data.get("max_presences")
-        self.max_members: Optional[int] = data.get("max_members")
-        self.max_video_channel_users: Optional[int] = data.get(
-            "max_video_channel_users"
-        )
-        self.vanity_url_code: Optional[str] = data.get("vanity_url_code")
-        self.description: Optional[str] = data.get("description")
-        self.banner: Optional[str] = data.get("banner")
-        self.premium_tier: int = data.get("premium_tier", 0)
-        self.premium_subscription_count: int = data.get(
-            "premium_subscription_count", 0
-        )
-        self.preferred_locale: str = data.get("preferred_locale", "en-US")
-        self.public_updates_channel_id: Optional[int] = (
-            int(data["public_updates_channel_id"])
-            if data.get("public_updates_channel_id")
-            else None
-        )
-        self.safety_alerts_channel_id: Optional[int] = (
-            int(data["safety_alerts_channel_id"])
-            if data.get("safety_alerts_channel_id")
-            else None
-        )
-        self.nsfw_level: int = data.get("nsfw_level", 0)
+        self._from_data(data)
 
     @property
     def created_at(self) -> Optional[datetime]:
@@ -0,0 +1,76 @@
+from __future__ import annotations
+from typing import List, Optional
+from datetime import datetime
+from .base import Field, Model, snowflake_list
+from .user import User
+
+
+class Member(Model):
+    # ``user`` is not in the table: partial updates refresh the shared User
+    # object instead of replacing it (see ConnectionState).
+    _FIELDS = (
+        Field("nick"),
+        Field("avatar"),
+        Field("roles", [], snowflake_list),
+        Field("joined_at"),
+        Field("premium_since"),
+        Field("deaf", False),
+        Field("mute", False),
+        Field("flags", 0),
+        Field("pending", False),
+        Field("communication_disabled_until"),
+    )
+
+    __slots__ = ("user", "guild_id") + tuple(field.attr or field.key for field in _FIELDS)
+
+    user: Optional[User]
+    guild_id: Optional[int]
+    nick: Optional[str]
+    avatar: Optional[str]
+    roles: List[int]
+    joined_at: Optional[str]
+    premium_since: Optional[str]
+    deaf: bool
+    mute: bool
+    flags: int
+    pending: bool
+    communication_disabled_until: Optional[str]
+
+    def __init__(self, data: dict, guild_id: Optional[int] = None):
+        self.user = User(data["user"]) if data.get("user") else None
+        self.guild_id = int(guild_id) if guild_id else None
+        self._from_data(data)
+
+    @property
+    def id(self) -> int:
+        return self.user.id if self.user else 0
+
+    @property
+    def display_name(self) -> str:
+        if self.nick:
+            return self.nick
+        return self.user.display_name if self.user else ""
+
+    @property
+    def mention(self) -> str:
+        return f"<@{self.id}>"
+
+    @property
+    def joined(self) -> Optional[datetime]:
+        if not self.joined_at:
+            return None
+        return datetime.fromisoformat(self.joined_at.replace("Z", "+00:00"))
+
+    def __str__(self) -> str:
+        return self.display_name
+
+    def __repr__(self) -> str:
+        return f"<Member id={self.id} guild_id={self.guild_id} nick={self.nick!r}>"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Member):
+            return self.id == other.id and self.guild_id == other.guild_id
+        return False
+
+    def __hash__(self) -> int:
+        return hash((self.id, self.guild_id))
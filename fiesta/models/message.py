@@ -1,10 +1,19 @@
-from typing import List, Optional
+from typing import List, Optional, Union
 from datetime import datetime
 from ..utils import snowflake_time, clean_content
+from .base import Field, Model
 from .user import User
 
 
-class Message:
+def _optional_user(data: Optional[dict]) -> Optional[User]:
+    return User(data) if data else None
+
+
+def _user_list(data: List[dict]) -> List[User]:
+    return [User(user) for user in data]
+
+
+class Message(Model):
     TYPES = {
         0: "DEFAULT",
         1: "RECIPIENT_ADD",
@@ -28,38 +37,76 @@ class Message:
         25: "ROLE_SUBSCRIPTION_PURCHASE",
     }
 
+    _FIELDS = (
+        Field("id", 0, int),
+        Field("channel_id", 0, int),
+        Field("guild_id"),
+        Field("author", None, _optional_user),
+        Field("content", ""),
+        Field("timestamp"),
+        Field("edited_timestamp"),
+        Field("tts", False),
+        Field("mention_everyone", False),
+        Field("mentions", [], _user_list),
+        Field("mention_roles", []),
+        Field("mention_channels", []),
+        Field("attachments", []),
+        Field("embeds", []),
+        Field("reactions", []),
+        Field("nonce"),
+        Field("pinned", False),
+        Field("webhook_id"),
+        Field("type", 0),
+        Field("activity"),
+        Field("application"),
+        Field("application_id"),
+        Field("message_reference"),
+        Field("flags", 0),
+        Field("referenced_message"),
+        Field("interaction"),
+        Field("thread"),
+        Field("components", []),
+        Field("sticker_items", []),
+        Field("position"),
+        Field("role_subscription_data"),
+    )
+
+    __slots__ = tuple(field.attr or field.key for field in _FIELDS)
+
+    id: int
+    channel_id: int
+    guild_id: Optional[str]
+    author: Optional[User]
+    content: str
+    timestamp: Optional[str]
+    edited_timestamp: Optional[str]
+    tts: bool
+    mention_everyone: bool
+    mentions: List[User]
+    mention_roles: List[str]
+    mention_channels: List[dict]
+    attachments: List[dict]
+    embeds: List[dict]
+    reactions: List[dict]
+    nonce: Optional[Union[int, str]]
+    pinned: bool
+    webhook_id: Optional[str]
+    type: int
+    activity: Optional[dict]
+    application: Optional[dict]
+    application_id: Optional[str]
+    message_reference: Optional[dict]
+    flags: int
+    referenced_message: Optional[dict]
+    interaction: Optional[dict]
+    thread: Optional[dict]
+    components: List[dict]
+    sticker_items: List[dict]
+    position: Optional[int]
+    role_subscription_data: Optional[dict]
+
     def __init__(self, data: dict):
-        self.id = int(data.get("id", 0))
-        self.channel_id = int(data.get("channel_id", 0))
-        self.guild_id = data.get("guild_id")
-        self.author = User(data.get("author", {})) if data.get("author") else None
-        self.content = data.get("content", "")
-        self.timestamp = data.get("timestamp")
-        self.edited_timestamp = data.get("edited_timestamp")
-        self.tts = data.get("tts", False)
-        self.mention_everyone = data.get("mention_everyone", False)
-        self.mentions = [User(user) for user in data.get("mentions", [])]
-        self.mention_roles = data.get("mention_roles", [])
-        self.mention_channels = data.get("mention_channels", [])
-        self.attachments = data.get("attachments", [])
-        self.embeds = data.get("embeds", [])
-        self.reactions = data.get("reactions", [])
-        self.nonce = data.get("nonce")
-        self.pinned = data.get("pinned", False)
-        self.webhook_id = data.get("webhook_id")
-        self.type = data.get("type", 0)
-        self.activity = data.get("activity")
-        self.application = data.get("application")
-        self.application_id = data.get("application_id")
-        self.message_reference = data.get("message_reference")
-        self.flags = data.get("flags", 0)
-        self.referenced_message = data.get("referenced_message")
-        self.interaction = data.get("interaction")
-        self.thread = data.get("thread")
-        self.components = data.get("components", [])
-        self.sticker_items = data.get("sticker_items", [])
-        self.position = data.get("position")
-        self.role_subscription_data = data.get("role_subscription_data")
+        self._from_data(data)
 
     @property
     def created_at(self) -> datetime:
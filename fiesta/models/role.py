@@ -1,22 +1,42 @@
 from typing import Optional
 from datetime import datetime
 from ..utils import snowflake_time
+from .base import Field, Model
 
 
-class Role:
+class Role(Model):
+    _FIELDS = (
+        Field("id", 0, int),
+        Field("name", ""),
+        Field("color", 0),
+        Field("hoist", False),
+        Field("icon"),
+        Field("unicode_emoji"),
+        Field("position", 0),
+        Field("permissions", "0"),
+        Field("managed", False),
+        Field("mentionable", False),
+        Field("tags", {}),
+        Field("flags", 0),
+    )
+
+    __slots__ = tuple(field.attr or field.key for field in _FIELDS)
+
+    id: int
+    name: str
+    color: int
+    hoist: bool
+    icon: Optional[str]
+    unicode_emoji: Optional[str]
+    position: int
+    permissions: str
+    managed: bool
+    mentionable: bool
+    tags: dict
+    flags: int
+
     def __init__(self, data: dict):
-        self.id = int(data.get("id", 0))
-        self.name = data.get("name", "")
-        self.color = data.get("color", 0)
-        self.hoist = data.get("hoist", False)
-        self.icon = data.get("icon")
-        self.unicode_emoji = data.get("unicode_emoji")
-        self.position = data.get("position", 0)
-        self.permissions = data.get("permissions", "0")
-        self.managed = data.get("managed", False)
-        self.mentionable = data.get("mentionable", False)
-        self.tags = data.get("tags", {})
-        self.flags = data.get("flags", 0)
+        self._from_data(data)
 
     @property
     def created_at(self) -> datetime:
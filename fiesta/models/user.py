@@ -2,23 +2,44 @@ from __future__ import annotations
 from typing import Optional
 from datetime import datetime
 from ..utils import snowflake_time
+from .base import Field, Model
 
 
-class User:
+class User(Model):
+    _FIELDS = (
+        Field("id", 0, int),
+        Field("username", ""),
+        Field("discriminator", "0000"),
+        Field("global_name"),
+        Field("avatar"),
+        Field("avatar_decoration_data", attr="avatar_decoration"),
+        Field("bot", False),
+        Field("system", False),
+        Field("verified", False),
+        Field("email"),
+        Field("flags", 0),
+        Field("premium_type", 0),
+        Field("public_flags", 0),
+    )
+
+    __slots__ = tuple(field.attr or field.key for field in _FIELDS)
+
+    id: int
+    username: str
+    discriminator: str
+    global_name: Optional[str]
+    avatar: Optional[str]
+    avatar_decoration: Optional[dict]
+    bot: bool
+    system: bool
+    verified: bool
+    email: Optional[str]
+    flags: int
+    premium_type: int
+    public_flags: int
+
     def __init__(self, data: dict):
-        self.id: int = int(data.get("id", 0))
-        self.username: str = data.get("username", "")
-        self.discriminator: str = data.get("discriminator", "0000")
-        self.global_name: Optional[str] = data.get("global_name")
-        self.avatar: Optional[str] = data.get("avatar")
-        self.avatar_decoration: Optional[str] = data.get("avatar_decoration_data")
-        self.bot: bool = data.get("bot", False)
-        self.system: bool = data.get("system", False)
-        self.verified: bool = data.get("verified", False)
-        self.email: Optional[str] = data.get("email")
-        self.flags: int = data.get("flags", 0)
-        self.premium_type: int = data.get("premium_type", 0)
-        self.public_flags: int = data.get("public_flags", 0)
+        self._from_data(data)
 
     @property
     def display_name(self) -> str:
@@ -0,0 +1,163 @@
+from __future__ import annotations
+import argparse
+import asyncio
+import os
+from typing import Any, Dict, Optional
+
+from aiohttp import web
+
+from .http import PRIORITY_HEADER, HTTPClient, Priority, create_connector, route_key
+
+
+FORWARD_REQUEST_HEADERS = ("Authorization", "Content-Type", "X-Audit-Log-Reason")
+FORWARD_RESPONSE_HEADERS = ("content-type", "retry-after", "via")
+
+
+class RateLimitProxy:
+    """Local HTTP server that forwards Discord REST calls for many processes.
+
+    The proxy owns the route buckets, the global limiter and the upstream
+    connection pool, so every process pointed at it (``HTTPClient(base_url=
+    ...)`` or ``unix_socket=...``) shares one view of the rate limits. 429s
+    are retried here before the response is handed back.
+    """
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        host: str = "127.0.0.1",
+        port: int = 8787,
+        path: Optional[str] = None,
+        global_rate: int = 50,
+        max_ratelimit_retries: int = 3,
+        connection_limit: int = 100,
+    ):
+        self.host = host
+        self.port = port
+        self.path = path
+        self.connection_limit = connection_limit
+        self.token = token or ""
+        self.global_rate = global_rate
+        self.max_ratelimit_retries = max_ratelimit_retries
+        # Built in start() so its asyncio primitives bind to the serving loop.
+        self.http: Optional[HTTPClient] = None
+        self._runner: Optional[web.AppRunner] = None
+        self.stats: Dict[str, int] = {"requests": 0, "ratelimited": 0, "errors": 0}
+
+    @property
+    def address(self) -> str:
+        return f"unix:{self.path}" if self.path else f"http://{self.host}:{self.port}"
+
+    def make_app(self) -> web.Application:
+        app = web.Application(client_max_size=0)
+        app.router.add_route("*", "/api/v{version}/{path:.*}", self._handle)
+        return app
+
+    async def start(self) -> None:
+        self.http = HTTPClient(
+            self.token,
+            global_rate=self.global_rate,
+            max_ratelimit_retries=self.max_ratelimit_retries,
+            connector=create_connector(limit=self.connection_limit),
+        )
+        await self.http.start()
+        self._runner = web.AppRunner(self.make_app())
+        await self._runner.setup()
+        if self.path:
+            if os.path.exists(self.path):
+                os.unlink(self.path)  # Left behind by a previous run
+            site: web.BaseSite = web.UnixSite(self._runner, self.path)
+        else:
+            site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+
+    async def close(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+        if self.http is None:
+            return
+        await self.http.close()
+        if self.http.connector is not None and not self.http.connector.closed:
+            await self.http.connector.close()
+        self.http = None
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await self.close()
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        http: HTTPClient = self.http  # type: ignore[assignment]
+        endpoint = "/" + request.match_info["path"]
+        if request.query_string:
+            endpoint = f"{endpoint}?{request.query_string}"
+        route, major = route_key(request.method, endpoint)
+        try:
+            priority = Priority(int(request.headers.get(PRIORITY_HEADER, Priority.NORMAL)))
+        except ValueError:
+            priority = Priority.NORMAL
+
+        headers = {k: request.headers[k] for k in FORWARD_REQUEST_HEADERS if k in request.headers}
+        body = await request.read()
+        url = f"{http.BASE_URL}{endpoint}"
+        self.stats["requests"] += 1
+
+        retries = 0
+        try:
+            while True:
+                status, upstream_headers, raw = await http._perform(
+                    request.method, url, route, major, priority, data=body or None, headers=headers
+                )
+                if status != 429 or retries >= http.max_ratelimit_retries:
+                    break
+                retries += 1
+                self.stats["ratelimited"] += 1
+                await asyncio.sleep(float(upstream_headers.get("Retry-After", "1")))
+        except Exception as e:
+            self.stats["errors"] += 1
+            return web.json_response({"message": f"Proxy error: {e}", "code": 0}, status=502)
+
+        response_headers: Dict[str, Any] = {
+            k: v
+            for k, v in upstream_headers.items()
+            if k.lower() in FORWARD_RESPONSE_HEADERS or k.lower().startswith("x-ratelimit-")
+        }
+        return web.Response(status=status, body=raw, headers=response_headers)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="fiesta-proxy", description="Shared Discord REST rate limit proxy"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--unix", metavar="PATH", help="listen on a unix socket instead")
+    parser.add_argument(
+        "--token",
+        default=os.environ.get("FIESTA_TOKEN"),
+        help="bot token used when clients send no Authorization header",
+    )
+    parser.add_argument("--global-rate", type=int, default=50)
+    parser.add_argument("--connection-limit", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    proxy = RateLimitProxy(
+        token=args.token,
+        host=args.host,
+        port=args.port,
+        path=args.unix,
+        global_rate=args.global_rate,
+        connection_limit=args.connection_limit,
+    )
+    print(f"fiesta-proxy listening on {proxy.address}")
+    try:
+        asyncio.run(proxy.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
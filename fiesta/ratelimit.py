@@ -0,0 +1,200 @@
+from __future__ import annotations
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Dict, List, Mapping, Optional
+
+
+class TokenBucket:
+    """Token bucket where every spent token comes back ``per`` seconds later.
+
+    Unlike a continuously refilled bucket this never allows more than
+    ``capacity`` acquisitions inside any ``per`` second window, which is how
+    Discord counts gateway commands and global requests. ``reserve`` keeps
+    tokens back for callers that acquire without one (e.g. heartbeats).
+    """
+
+    def __init__(self, capacity: int, per: float):
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1.")
+        self.capacity = capacity
+        self.per = per
+        self._spent: Deque[float] = deque()
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self.per
+        spent = self._spent
+        while spent and spent[0] <= cutoff:
+            spent.popleft()
+
+    @property
+    def available(self) -> int:
+        self._expire(time.monotonic())
+        return self.capacity - len(self._spent)
+
+    def delay(self, reserve: int = 0) -> float:
+        now = time.monotonic()
+        self._expire(now)
+        excess = len(self._spent) - (self.capacity - reserve - 1)
+        if excess <= 0:
+            return 0.0
+        return max(0.0, self._spent[excess - 1] + self.per - now)
+
+    def try_acquire(self, reserve: int = 0) -> bool:
+        now = time.monotonic()
+        self._expire(now)
+        if self.capacity - len(self._spent) <= reserve:
+            return False
+        self._spent.append(now)
+        return True
+
+    async def acquire(self, reserve: int = 0) -> None:
+        while not self.try_acquire(reserve):
+            await asyncio.sleep(self.delay(reserve))
+
+    def reset(self) -> None:
+        self._spent.clear()
+
+
+class RateLimitBucket:
+    """Client-side view of one Discord rate limit bucket.
+
+    State is learned from ``X-RateLimit-*`` response headers. Up to
+    ``remaining`` requests are admitted at once; when the bucket is drained,
+    callers sleep until ``reset-after`` instead of running into a 429.
+    Until the first response arrives only one request is let through.
+    """
+
+    def __init__(self) -> None:
+        self.limit: Optional[int] = None
+        self.remaining: int = 1
+        self.reset_at: float = 0.0
+        self.inflight: int = 0
+        self.unlimited: bool = False
+        self.last_used: float = time.monotonic()
+        self._waiting: int = 0
+        self._wake = asyncio.Event()
+
+    @property
+    def idle(self) -> bool:
+        return self.inflight == 0 and self._waiting == 0
+
+    def _try_acquire(self, now: float) -> bool:
+        if self.unlimited:
+            self.inflight += 1
+            return True
+        if (self.reset_at and now >= self.reset_at) or (
+            not self.reset_at and self.inflight == 0 and self.remaining <= 0
+        ):
+            self.remaining = self.limit or 1
+            self.reset_at = 0.0
+        if self.remaining - self.inflight > 0:
+            self.inflight += 1
+            return True
+        return False
+
+    async def acquire(self) -> None:
+        self._waiting += 1
+        try:
+            while True:
+                now = time.monotonic()
+                self.last_used = now
+                if self._try_acquire(now):
+                    return
+                timeout = self.reset_at - now if self.reset_at > now else None
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._waiting -= 1
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        self.unlimited = False
+        limit = headers.get("X-RateLimit-Limit")
+        if limit is not None:
+            self.limit = int(limit)
+        self.remaining = int(remaining)
+        reset_after = headers.get("X-RateLimit-Reset-After")
+        if reset_after is not None:
+            self.reset_at = time.monotonic() + float(reset_after)
+
+    def release(self, headers: Optional[Mapping[str, str]] = None, status: int = 0) -> None:
+        self.inflight = max(0, self.inflight - 1)
+        self.last_used = time.monotonic()
+        if headers is not None:
+            if "X-RateLimit-Remaining" in headers:
+                self.update(headers)
+            elif 200 <= status < 400:
+                # Routes without rate limit headers are not limited per bucket.
+                self.unlimited = True
+        self._wake.set()
+        self._wake.clear()
+
+
+class PriorityLimiter:
+    """Hands out TokenBucket tokens to waiting callers by lane.
+
+    Lane 0 is served first; a caller only takes the fast path when no caller
+    of the same or higher priority is already queued. Per-lane queue wait
+    times are tracked in ``stats``.
+    """
+
+    def __init__(self, bucket: TokenBucket, lanes: int = 3):
+        self.bucket = bucket
+        self._queues: List[Deque[asyncio.Future[None]]] = [deque() for _ in range(lanes)]
+        self._pump_task: Optional[asyncio.Task[None]] = None
+        self.stats: List[Dict[str, float]] = [
+            {"requests": 0, "total_wait": 0.0, "max_wait": 0.0} for _ in range(lanes)
+        ]
+
+    def queued(self, lane: int) -> int:
+        return sum(1 for future in self._queues[lane] if not future.done())
+
+    def _record(self, lane: int, waited: float) -> None:
+        stats = self.stats[lane]
+        stats["requests"] += 1
+        stats["total_wait"] += waited
+        if waited > stats["max_wait"]:
+            stats["max_wait"] = waited
+
+    async def acquire(self, lane: int, exempt: bool = False) -> None:
+        started = time.monotonic()
+        if exempt or (
+            not any(self._queues[index] for index in range(lane + 1))
+            and self.bucket.try_acquire()
+        ):
+            self._record(lane, 0.0)
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._queues[lane].append(future)
+        if self._pump_task is None or self._pump_task.done():
+            self._pump_task = asyncio.create_task(self._pump())
+        await future
+        self._record(lane, time.monotonic() - started)
+
+    def _next_waiter(self) -> Optional[Deque[asyncio.Future[None]]]:
+        for queue in self._queues:
+            while queue and queue[0].done():
+                queue.popleft()
+            if queue:
+                return queue
+        return None
+
+    async def _pump(self) -> None:
+        while True:
+            queue = self._next_waiter()
+            if queue is None:
+                return
+            if not self.bucket.try_acquire():
+                await asyncio.sleep(self.bucket.delay())
+                continue
+            # Re-check: a higher lane may have queued while we slept.
+            queue = self._next_waiter()
+            if queue is None:
+                return
+            queue.popleft().set_result(None)
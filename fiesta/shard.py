@@ -0,0 +1,142 @@
+from __future__ import annotations
+import asyncio
+from typing import Any, Dict, List, Optional, Sequence
+
+from .client import Client
+from .gateway import Gateway
+from .errors import LoginFailure
+
+
+class IdentifyScheduler:
+    """Paces IDENTIFY calls according to Discord's ``max_concurrency``.
+
+    Shards share a rate limit key of ``shard_id % max_concurrency``; each key
+    allows one IDENTIFY every ``interval`` seconds, so up to
+    ``max_concurrency`` shards come up in parallel per wave.
+    """
+
+    def __init__(self, max_concurrency: int = 1, interval: float = 5.0):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1.")
+        self.max_concurrency = max_concurrency
+        self.interval = interval
+        self._locks: Dict[int, asyncio.Lock] = {}
+        self._next_allowed: Dict[int, float] = {}
+
+    def bucket_for(self, shard_id: int) -> int:
+        return shard_id % self.max_concurrency
+
+    async def acquire(self, shard_id: int) -> None:
+        key = self.bucket_for(shard_id)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            loop = asyncio.get_running_loop()
+            delay = self._next_allowed.get(key, 0.0) - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_allowed[key] = loop.time() + self.interval
+
+
+class AutoShardedClient(Client):
+    """Client that runs several gateway shards on one event loop"""
+
+    def __init__(
+        self,
+        *args: Any,
+        shard_count: Optional[int] = None,
+        shard_ids: Optional[Sequence[int]] = None,
+        identify_scheduler: Optional[IdentifyScheduler] = None,
+        sessions: Optional[Dict[int, Dict[str, Any]]] = None,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        if shard_ids is not None and shard_count is None:
+            raise ValueError("shard_count is required when shard_ids is given.")
+        self.shard_count: Optional[int] = shard_count
+        self.shard_ids: Optional[List[int]] = list(shard_ids) if shard_ids is not None else None
+        self.identify_scheduler = identify_scheduler
+        self._sessions: Dict[int, Dict[str, Any]] = dict(sessions or {})
+        self._gateways: Dict[int, Gateway] = {}
+
+    @property
+    def shards(self) -> Dict[int, Gateway]:
+        return dict(self._gateways)
+
+    def shard_for_guild(self, guild_id: int) -> int:
+        if not self.shard_count:
+            return 0
+        return (int(guild_id) >> 22) % self.shard_count
+
+    @property
+    def _gateway_list(self) -> List[Gateway]:
+        return list(self._gateways.values())
+
+    def get_shard(self, shard_id: int) -> Optional[Gateway]:
+        return self._gateways.get(shard_id)
+
+    async def start(self, token: str) -> None:
+        self._http = self._create_http(token)
+        info: Dict[str, Any] = {}
+        try:
+            await self._http.start()
+            # Cluster workers are handed their shards and scheduler up front.
+            if self.shard_count is None or self.identify_scheduler is None:
+                info = await self._http.get_gateway_bot()
+        except Exception as e:
+            raise LoginFailure(f"Failed to login: {e}") from e
+
+        limits = info.get("session_start_limit", {})
+        if self.shard_count is None:
+            self.shard_count = int(info.get("shards", 1))
+        if self.shard_ids is None:
+            self.shard_ids = list(range(self.shard_count))
+        if not self.shard_ids:
+            raise ValueError("AutoShardedClient needs at least one shard to start.")
+
+        remaining = limits.get("remaining")
+        if remaining is not None and remaining < len(self.shard_ids):
+            reset_after = limits.get("reset_after", 0) / 1000.0
+            raise LoginFailure(
+                f"Session start limit exhausted ({remaining} left for "
+                f"{len(self.shard_ids)} shards, resets in {reset_after:.0f}s)"
+            )
+
+        if self.identify_scheduler is None:
+            self.identify_scheduler = IdentifyScheduler(
+                int(limits.get("max_concurrency", 1))
+            )
+
+        for shard_id in self.shard_ids:
+            self._gateways[shard_id] = self._create_gateway(
+                token,
+                shard=(shard_id, self.shard_count),
+                identify_scheduler=self.identify_scheduler,
+            )
+        self._gateway = self._gateways[self.shard_ids[0]]
+
+        for shard_id, state in self._sessions.items():
+            if shard_id in self._gateways:
+                self._gateways[shard_id].restore_session(state)
+
+        try:
+            await asyncio.gather(
+                *(
+                    gw.connect(resume=gw.shard_id in self._sessions)
+                    for gw in self._gateways.values()
+                )
+            )
+        except Exception as e:
+            raise LoginFailure(f"Failed to login: {e}") from e
+
+    async def close(self) -> None:
+        await asyncio.gather(
+            *(gw.close() for gw in self._gateways.values()), return_exceptions=True
+        )
+        await self._scheduler.close()
+        if self._coalescer:
+            await self._coalescer.close()
+        if self._http:
+            await self._http.close()
+        for connector in (self._connector, self._gateway_connector):
+            if connector and not connector.closed:
+                await connector.close()
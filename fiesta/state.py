@@ -0,0 +1,200 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict, FrozenSet, Optional, Set
+
+from .models import Channel, Guild, Member, Role, User
+
+
+class ConnectionState:
+    """Entity cache kept current by gateway dispatch events.
+
+    Everything is keyed by int snowflake, so lookups never touch the
+    network. Events are applied inline on the gateway read loop, in the
+    order Discord sent them, before any handler sees them.
+    """
+
+    def __init__(self, cache_members: bool = True):
+        self.cache_members = cache_members
+        self.guilds: Dict[int, Guild] = {}
+        self.channels: Dict[int, Channel] = {}
+        self.users: Dict[int, User] = {}
+        self.roles: Dict[int, Role] = {}
+        self.members: Dict[int, Dict[int, Member]] = {}
+        self._guild_channels: Dict[int, Set[int]] = {}
+        self._guild_roles: Dict[int, Set[int]] = {}
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], None]] = {
+            "READY": self._ready,
+            "GUILD_CREATE": self._guild_create,
+            "GUILD_UPDATE": self._guild_update,
+            "GUILD_DELETE": self._guild_delete,
+            "CHANNEL_CREATE": self._channel_upsert,
+            "CHANNEL_UPDATE": self._channel_upsert,
+            "CHANNEL_DELETE": self._channel_delete,
+            "THREAD_CREATE": self._channel_upsert,
+            "THREAD_UPDATE": self._channel_upsert,
+            "THREAD_DELETE": self._channel_delete,
+            "GUILD_ROLE_CREATE": self._role_upsert,
+            "GUILD_ROLE_UPDATE": self._role_upsert,
+            "GUILD_ROLE_DELETE": self._role_delete,
+            "GUILD_MEMBER_ADD": self._member_upsert,
+            "GUILD_MEMBER_UPDATE": self._member_upsert,
+            "GUILD_MEMBER_REMOVE": self._member_remove,
+            "GUILD_MEMBERS_CHUNK": self._members_chunk,
+            "USER_UPDATE": self._user_update,
+        }
+
+    @property
+    def events(self) -> FrozenSet[str]:
+        return frozenset(self._handlers)
+
+    def apply(self, event_type: str, data: Dict[str, Any]) -> None:
+        handler = self._handlers.get(event_type)
+        if handler is not None:
+            handler(data)
+
+    def clear(self) -> None:
+        for cache in (
+            self.guilds,
+            self.channels,
+            self.users,
+            self.roles,
+            self.members,
+            self._guild_channels,
+            self._guild_roles,
+        ):
+            cache.clear()
+
+    def get_guild(self, guild_id: int) -> Optional[Guild]:
+        return self.guilds.get(int(guild_id))
+
+    def get_channel(self, channel_id: int) -> Optional[Channel]:
+        return self.channels.get(int(channel_id))
+
+    def get_user(self, user_id: int) -> Optional[User]:
+        return self.users.get(int(user_id))
+
+    def get_role(self, role_id: int) -> Optional[Role]:
+        return self.roles.get(int(role_id))
+
+    def get_member(self, guild_id: int, user_id: int) -> Optional[Member]:
+        return self.members.get(int(guild_id), {}).get(int(user_id))
+
+    # Known entities are updated in place so references held elsewhere
+    # (members, handlers, user code) keep seeing current data.
+
+    def _store_user(self, data: Dict[str, Any]) -> User:
+        user = self.users.get(int(data["id"]))
+        if user is None:
+            user = self.users[int(data["id"])] = User(data)
+        else:
+            user._update(data)
+        return user
+
+    def _store_channel(self, data: Dict[str, Any], guild_id: Optional[int] = None) -> None:
+        channel = self.channels.get(int(data["id"]))
+        if channel is None:
+            channel = self.channels[int(data["id"])] = Channel(data)
+        else:
+            channel._update(data)
+        if guild_id is not None and channel.guild_id is None:
+            channel.guild_id = guild_id  # Omitted inside GUILD_CREATE
+        if channel.guild_id is not None:
+            self._guild_channels.setdefault(channel.guild_id, set()).add(channel.id)
+
+    def _store_role(self, data: Dict[str, Any], guild_id: int) -> None:
+        role = self.roles.get(int(data["id"]))
+        if role is None:
+            role = self.roles[int(data["id"])] = Role(data)
+        else:
+            role._update(data)
+        self._guild_roles.setdefault(guild_id, set()).add(role.id)
+
+    def _store_member(self, data: Dict[str, Any], guild_id: int) -> None:
+        if not data.get("user"):
+            return
+        user = self._store_user(data["user"])
+        if not self.cache_members:
+            return
+        members = self.members.setdefault(guild_id, {})
+        member = members.get(user.id)
+        if member is None:
+            member = members[user.id] = Member(data, guild_id=guild_id)
+            member.user = user  # One User object per id across guilds
+        else:
+            member._update(data)
+
+    def _ready(self, data: Dict[str, Any]) -> None:
+        if data.get("user"):
+            self._store_user(data["user"])
+
+    def _store_guild(self, data: Dict[str, Any]) -> Guild:
+        guild = self.guilds.get(int(data["id"]))
+        if guild is None:
+            guild = self.guilds[int(data["id"])] = Guild(data)
+        else:
+            guild._update(data)
+        return guild
+
+    def _guild_create(self, data: Dict[str, Any]) -> None:
+        guild = self._store_guild(data)
+        for channel in data.get("channels", []):
+            self._store_channel(channel, guild.id)
+        for thread in data.get("threads", []):
+            self._store_channel(thread, guild.id)
+        for role in data.get("roles", []):
+            self._store_role(role, guild.id)
+        for member in data.get("members", []):
+            self._store_member(member, guild.id)
+
+    def _guild_update(self, data: Dict[str, Any]) -> None:
+        guild = self._store_guild(data)
+        for role in data.get("roles", []):
+            self._store_role(role, guild.id)
+
+    def _guild_delete(self, data: Dict[str, Any]) -> None:
+        guild_id = int(data["id"])
+        if data.get("unavailable"):
+            return  # Outage; the guild comes back with a GUILD_CREATE
+        self.guilds.pop(guild_id, None)
+        for channel_id in self._guild_channels.pop(guild_id, ()):
+            self.channels.pop(channel_id, None)
+        for role_id in self._guild_roles.pop(guild_id, ()):
+            self.roles.pop(role_id, None)
+        self.members.pop(guild_id, None)
+
+    def _channel_upsert(self, data: Dict[str, Any]) -> None:
+        self._store_channel(data)
+
+    def _channel_delete(self, data: Dict[str, Any]) -> None:
+        channel = self.channels.pop(int(data["id"]), None)
+        if channel is not None and channel.guild_id is not None:
+            self._guild_channels.get(channel.guild_id, set()).discard(channel.id)
+
+    def _role_upsert(self, data: Dict[str, Any]) -> None:
+        self._store_role(data["role"], int(data["guild_id"]))
+
+    def _role_delete(self, data: Dict[str, Any]) -> None:
+        role_id = int(data["role_id"])
+        self.roles.pop(role_id, None)
+        self._guild_roles.get(int(data["guild_id"]), set()).discard(role_id)
+
+    def _member_upsert(self, data: Dict[str, Any]) -> None:
+        self._store_member(data, int(data["guild_id"]))
+
+    def _member_remove(self, data: Dict[str, Any]) -> None:
+        members = self.members.get(int(data["guild_id"]))
+        if members is not None:
+            members.pop(int(data["user"]["id"]), None)
+
+    def _members_chunk(self, data: Dict[str, Any]) -> None:
+        guild_id = int(data["guild_id"])
+        for member in data.get("members", []):
+            self._store_member(member, guild_id)
+
+    def _user_update(self, data: Dict[str, Any]) -> None:
+        self._store_user(data)
+
+    def __repr__(self) -> str:
+        return (
+            f"<ConnectionState guilds={len(self.guilds)} channels={len(self.channels)} "
+            f"users={len(self.users)}>"
+        )
@@ -11,6 +11,13 @@ def snowflake_time(snowflake: int) -> datetime:
     return datetime.fromtimestamp(timestamp, tz=timezone.utc)
 
 
+def time_snowflake(dt: datetime) -> int:
+    """Smallest snowflake for a timestamp, usable as a pagination cursor"""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (int(dt.timestamp() * 1000) - 1420070400000) << 22
+
+
 def parse_mention(content: str) -> Optional[int]:
     """Extract user ID from mention string"""
     match = re.search(r"<@!?(\d+)>", content)
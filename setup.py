@@ -47,5 +47,8 @@ setup(
             "fastchardet>=0.2.0",
         ],
     },
+    entry_points={
+        "console_scripts": ["fiesta-proxy=fiesta.proxy:main"],
+    },
     keywords="discord api bot async hybrid commands interactions",
 )